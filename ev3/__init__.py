@@ -10,12 +10,59 @@ Simple usage:
 
 """
 import re
+import sys
 import time
 import threading
-from rawdevice import analogdevice, dcm, iicdevice, lcd, motordevice, sound, uartdevice, ui, lms2012
+import importlib
 
 __version__ = '0.2'
 
+
+class _LazyModule(object):
+    """Stands in for a rawdevice module until one of its attributes is used.
+
+    The module is imported then and replaces the placeholder in this
+    module's namespace, so `import ev3` does not load lms2012, PIL or
+    any device module a script never touches.
+
+    """
+
+    def __init__(self, name, alias=None):
+        self.__dict__['__name__'] = 'ev3.rawdevice.' + name
+        self.__dict__['_alias'] = alias or name
+
+    def _load(self):
+        module = importlib.import_module(self.__name__)
+        globals()[self._alias] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        return '<lazy module %r>' % self.__name__
+
+
+analogdevice = _LazyModule('analogdevice')
+dcm = _LazyModule('dcm')
+iicdevice = _LazyModule('iicdevice')
+iicexecutor = _LazyModule('iicexecutor')
+lcd = _LazyModule('lcd')
+lms2012 = _LazyModule('lms2012')
+motordevice = _LazyModule('motordevice')
+sound = _LazyModule('sound')
+uartdevice = _LazyModule('uartdevice')
+ui = _LazyModule('ui')
+_snapshot = _LazyModule('snapshot', '_snapshot')
+
+
+def _imported(module):
+    # The module if anybody imported it already, None otherwise.
+    return sys.modules.get(module.__name__)
+
 _AMP_CIN = 22.0
 _AMP_VIN = 0.5
 _VCE = 0.05
@@ -82,14 +129,14 @@ def close_all_devices():
     """Close all devices.
 
     """
-    ui.close_device()
-    uartdevice.close_device()
-    sound.close_device()
-    motordevice.close_device()
-    lcd.close_device()
-    iicdevice.close_device()
-    dcm.close_device()
-    analogdevice.close_device()
+    executor = _imported(iicexecutor)
+    if executor is not None:
+        executor.shutdown()
+    # Modules never imported have no open device.
+    for module in (ui, uartdevice, sound, motordevice, lcd, iicdevice, dcm, analogdevice):
+        module = _imported(module)
+        if module is not None:
+            module.close_device()
 
 
 def get_battery():
@@ -109,6 +156,21 @@ def get_battery():
     return battery_v, battery_i, motor_i
 
 
+def snapshot(into=None):
+    """Copy the state of all open devices at once.
+
+    Args:
+        into (Snapshot): previous snapshot to refill instead of allocating one.
+
+    Returns:
+        Snapshot. Read-only view with getters mirroring the device modules
+        (get_pin6, get_uart_value_bytes, is_pressed, get_speed, ...) and
+        a shared *timestamp*.
+
+    """
+    return _snapshot.capture(into)
+
+
 def is_up_button_pressed():
     return ui.is_pressed(BUTTON_UP)
 
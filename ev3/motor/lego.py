@@ -44,10 +44,15 @@ class EV3Motor(object):
     def start(self, direction, speed):
         if (direction == self.MOVE_NONE):
             return
+        self.direction = direction
+        self._start_ports(self._port_mask, direction, speed)
+
+    # Resets, sets polarity and speed of all |ports| and starts them together.
+    def _start_ports(self, ports, direction, speed):
         speed = self._to_max_speed(speed)
-        motordevice.reset(self._port_mask)
-        self.set_direction(direction)
-        motordevice.speed(self._port_mask, speed, True)
+        motordevice.reset(ports)
+        motordevice.polarity(ports, direction)
+        motordevice.speed(ports, speed, True)
 
     """Sets motor's direction"""    
     def set_direction(self, direction):
@@ -135,88 +140,132 @@ class EV3Drive(EV3Motor):
             self._port_mask |= 1 << motor_port
         self.direction = self.MOVE_NONE
      
-    # Helper allowing to avoid code duplication   
-    def _call_func(self, *args):
-        which = args[len(args) - 1] # which must always be the last arg
-        name = args[len(args) - 2] # name must always be the second arg from the end
-        args = args[:len(args)-2] # remove which & name
+    def _is_all(self, which):
         if not isinstance(which, collections.Iterable):
             which = [which]
-        if (self.MOTOR_ALL in which):
-            getattr(super(EV3Drive, self), name)(*args)
-        else:
-            for motor_index in which:
-                if (motor_index in self._map):
-                    getattr(self._motors[self._map[motor_index]], name)(*args)        
-    
+        return self.MOTOR_ALL in which
+
+    # Motors selected by |which|, a motor index, a list of them or MOTOR_ALL.
+    def _selected(self, which):
+        if self._is_all(which):
+            return list(self._motors)
+        if not isinstance(which, collections.Iterable):
+            which = [which]
+        return [self._motors[self._map[motor_index]] for motor_index in which
+                if motor_index in self._map]
+
+    @staticmethod
+    def _mask(motors):
+        ports = 0
+        for motor in motors:
+            ports |= motor._port_mask
+        return ports
+
+    # Applies (motor, speed, restart) triples like EV3Motor.set_speed(), or
+    # EV3Motor.start() going forward when |restart| is set. Motors ending up
+    # with the same command share one port mask, so they change together.
+    def _apply_speeds(self, speeds):
+        stopped = 0
+        started = {}
+        running = {}
+        for motor, speed, restart in speeds:
+            if (speed <= 0 and not restart):
+                stopped |= motor._port_mask
+                motor.direction = self.MOVE_NONE
+            elif (restart or motor.direction == self.MOVE_NONE):
+                started[speed] = started.get(speed, 0) | motor._port_mask
+                motor.direction = self.MOVE_FORWARD
+            else:
+                speed = self._to_max_speed(speed)
+                running[speed] = running.get(speed, 0) | motor._port_mask
+        if stopped:
+            motordevice.stop(stopped, False)
+        for speed, ports in started.items():
+            self._start_ports(ports, self.MOVE_FORWARD, speed)
+        for speed, ports in running.items():
+            motordevice.speed(ports, speed, True)
+
     """Similar to EV3Motor.start() with possibility to point at motor(s)
        which should be started."""
     def start(self, direction, speed, which = [MOTOR_ALL]):
         self._make_sure_direction_is_consistent_everywhere(direction, which)
-        self._call_func(direction, speed, "start", which)
-                    
+        if (direction == self.MOVE_NONE):
+            return
+        motors = self._selected(which)
+        for motor in motors:
+            motor.direction = direction
+        if motors:
+            self._start_ports(self._mask(motors), direction, speed)
+
     def _set_direction(self, direction, which):
         for motor_index in which:
             if (motor_index in self._map):
                 self._motors[self._map[motor_index]].direction = direction
-                
+
     def _make_sure_direction_is_consistent_everywhere(self, direction, which):
-        if (self.MOTOR_ALL in which):
+        if self._is_all(which):
+            self.direction = direction
             self._set_direction(direction, self._map.keys())
-                    
+
     """Similar to EV3Motor.direction() with possibility to point at motor(s)
-       polarity pf which should be changed."""    
+       polarity pf which should be changed."""
     def set_direction(self, direction, which = [MOTOR_ALL]):
         if (direction == self.MOVE_NONE):
             return
         self._make_sure_direction_is_consistent_everywhere(direction, which)
-        self._call_func(direction, "set_direction", which)
+        motors = self._selected(which)
+        for motor in motors:
+            motor.direction = direction
+        if motors:
+            motordevice.polarity(self._mask(motors), direction)
 
-    
     """Similar to EV3Motor.rotate() with possibility to point at motor(s)
-       which should be rotated."""        
+       which should be rotated."""
     def rotate(self, direction, speed, angle, which = [MOTOR_ALL]):
-        self._call_func(direction, speed, angle, "rotate", which)
-                    
+        ports = self._mask(self._selected(which))
+        if ports:
+            motordevice.polarity(ports, direction)
+            motordevice.step_speed(ports, speed, 0, max(0, angle), 0)
+
     """Similar to EV3Motor.stop() with possibility to point at motor(s)
-       which should be stopped."""    
+       which should be stopped."""
     def stop(self, which = [MOTOR_ALL]):
-        self._make_sure_direction_is_consistent_everywhere(self.MOVE_NONE, which)        
-        self._call_func("stop", which)
-                    
+        self._make_sure_direction_is_consistent_everywhere(self.MOVE_NONE, which)
+        motors = self._selected(which)
+        for motor in motors:
+            motor.direction = self.MOVE_NONE
+        if motors:
+            motordevice.stop(self._mask(motors), False)
+
     """Similar to EV3Motor.set_speed() with possibility to point at motor(s)
-       which should be applied the speed change."""    
+       which should be applied the speed change."""
     def set_speed(self, speed, which = [MOTOR_ALL]):
-        self._call_func(speed, "set_speed", which)
-    
+        if (speed <= 0):
+            self.stop(which)
+            return
+        if (self._is_all(which) and self.direction == self.MOVE_NONE):
+            self.direction = self.MOVE_FORWARD
+        self._apply_speeds([(motor, speed, False) for motor in self._selected(which)])
+
     """Similar to EV3Motor.accelerate() with possibility to point at motor(s)
-       which should be accelerated."""    
+       which should be accelerated."""
     def accelerate(self, delta, which = [MOTOR_ALL]):
-        if not isinstance(which, collections.Iterable):
-            which = [which]
-        # Not perfect but good enough. super(EV3Drive, self).accelerate() can't be called.
-        if (self.MOTOR_ALL in which):
-            for motor in self._motors:
-                motor.accelerate(delta)
-        else:
-            for motor_index in which:
-                if (motor_index in self._map):
-                    self._motors[self._map[motor_index]].accelerate(delta)
-                    
+        # Motors at different speeds end up with separate commands.
+        change = min(delta, self.MAX_SPEED) if delta >= 0 else max(delta, -self.MAX_SPEED)
+        speeds = []
+        for motor in self._selected(which):
+            current = motor.get_speed()
+            if (current == 0):
+                speeds.append((motor, delta, True))
+            else:
+                speeds.append((motor, current + change, False))
+        self._apply_speeds(speeds)
+
     """Similar to EV3Motor.accelerate() with possibility to point at motor(s)
-       which should be slowed down."""    
+       which should be slowed down."""
     def slow_down(self, delta, which = [MOTOR_ALL]):
-        if not isinstance(which, collections.Iterable):
-            which = [which]
-        # Not perfect but good enough. super(EV3Drive, self).slow_down() can't be called.
-        if (self.MOTOR_ALL in which):
-            for motor in self._motors:
-                motor.slow_down(delta)
-        else:
-            for motor_index in which:
-                if (motor_index in self._map):
-                    self._motors[self._map[motor_index]].slow_down(delta)
-                    
+        self.accelerate(-abs(delta), which)
+
     """Gets speed of a one of the motors."""    
     def get_motor_speed(self, which):
         if (isinstance(which, collections.Iterable) or which == self.MOTOR_ALL or which not in self._map):
@@ -1,5 +1,13 @@
-__all__ = ["analogdevice", "dcm", "iicdevice", "lcd",
-           "motordevice", "sound", "uartdevice", "ui"]
+__all__ = ["analogdevice", "bitmap", "chart", "dcm", "font", "iicdevice", "iicexecutor",
+           "lcd", "motordevice", "poll", "snapshot", "sound", "uartdevice", "ui"]
 
-import lms2012
-devcon = lms2012.DEVCON()
+_devcon = None
+
+
+def get_devcon():
+    """DEVCON structure shared by the connection setup ioctls."""
+    global _devcon
+    if _devcon is None:
+        from . import lms2012
+        _devcon = lms2012.DEVCON()
+    return _devcon
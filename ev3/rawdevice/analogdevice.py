@@ -1,13 +1,15 @@
 import os
-from ctypes import sizeof
+from ctypes import addressof, c_char, memmove, sizeof
 from mmap import mmap, MAP_SHARED, PROT_READ, PROT_WRITE
-from . import lms2012
+from . import lms2012, poll
 
 _initialized = False
 _analogfile = None
 _analogmm = None
 _analog = None
 
+DEVICE_LOGBUF_SIZE = lms2012.DEVICE_LOGBUF_SIZE
+
 
 def open_device():
     global _initialized
@@ -30,6 +32,86 @@ def get_pin1(port):
     return _analog.InPin1[port]
 
 
+class LogReader(object):
+    """Drains the Pin1 or Pin6 log of a port incrementally.
+
+    The driver logs every conversion in a DEVICE_LOGBUF_SIZE deep ring, so
+    pulses shorter than the polling period still show up in the log. The
+    reader keeps its own cursor and leaves the shared LogIn/LogOut alone.
+    An overrun is detected by checking that the last consumed slot still
+    holds the value read from it. The dropped count is then estimated from
+    the time elapsed since the previous read.
+
+    Args:
+        port (int): sensor port.
+        pin (int): 1 or 6.
+        period (float): seconds between two logged values, the driver's
+            DEVICE_UPDATE_TIME by default.
+
+    """
+
+    def __init__(self, port, pin=6, period=None):
+        self.port = port
+        self.pin = pin
+        self.period = period or lms2012.DEVICE_UPDATE_TIME / 1e9
+        self.dropped = 0
+        self.sync()
+
+    def _log(self):
+        if self.pin == 1:
+            return _analog.Pin1[self.port]
+        return _analog.Pin6[self.port]
+
+    def sync(self):
+        """Skip all values logged so far."""
+        self._index = _analog.Actual[self.port]
+        self._last = self._log()[self._index]
+        self._time = poll.monotonic()
+        self._backlog = 0
+
+    def read_into(self, buf):
+        """Copy pending values, oldest first, into a caller-supplied buffer.
+
+        Args:
+            buf: writable buffer of DATA16 values, e.g. array.array('h').
+            Values that do not fit are kept for the next call.
+
+        Returns:
+            tuple. (int, int) -- number of values copied and number of
+            values lost to an overrun.
+
+        """
+        log = self._log()
+        now = poll.monotonic()
+        actual = _analog.Actual[self.port]
+        pending = (actual - self._index) % DEVICE_LOGBUF_SIZE
+        # Values the driver should have logged since we last caught up.
+        logged = self._backlog + int((now - self._time) / self.period)
+        dropped = 0
+        if log[self._index] != self._last:
+            # Lapped by the writer; the slot after Actual is the next one
+            # to be overwritten, so it is left out.
+            dropped = max(pending + 1, logged - (DEVICE_LOGBUF_SIZE - 1))
+            pending = DEVICE_LOGBUF_SIZE - 1
+            self._index = (actual + 1) % DEVICE_LOGBUF_SIZE
+        item = sizeof(log._type_)
+        size = len(buf) * getattr(buf, 'itemsize', 1)
+        target = addressof((c_char * size).from_buffer(buf))
+        count = min(pending, size // item)
+        start = (self._index + 1) % DEVICE_LOGBUF_SIZE
+        first = min(count, DEVICE_LOGBUF_SIZE - start)
+        memmove(target, addressof(log) + start * item, first * item)
+        if count > first:
+            memmove(target + first * item, addressof(log),
+                    (count - first) * item)
+        self._index = (self._index + count) % DEVICE_LOGBUF_SIZE
+        self._last = log[self._index]
+        self._time = now
+        self._backlog = pending - count
+        self.dropped += dropped
+        return count, dropped
+
+
 def get_analog():
     return _analog
 
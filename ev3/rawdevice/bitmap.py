@@ -0,0 +1,237 @@
+"""1 bpp drawing without PIL.
+
+A Bitmap keeps its pixels the way the LCD framebuffer does: rows of
+*stride* bytes, leftmost pixel in the least significant bit, 1 is black.
+lcd.show() copies it to the screen without any conversion, and the
+rows touched since the last show() are tracked in *top*/*bottom*. PIL is
+only imported to convert from or to a PIL image.
+
+Simple usage:
+    >>> from ev3.rawdevice import lcd
+    >>> screen = lcd.new_bitmap()
+    >>> screen.rectangle(10, 10, 60, 30)
+    >>> screen.line(0, 127, 177, 0)
+    >>> lcd.show(screen)
+
+"""
+import binascii
+
+WHITE = 0
+BLACK = 1
+
+# PIL mode '1' byte <-> framebuffer byte: inverted and with the bit order
+# reversed. The mapping is its own inverse.
+PIL_TRANSLATION = bytes(bytearray(int('{:08b}'.format(~i & 0xff)[::-1], 2) for i in range(256)))
+
+# Rows are handled as integers: with the leftmost pixel in the least
+# significant bit, pixel x of a row is bit x of its little-endian value.
+if hasattr(int, 'from_bytes'):
+    def _to_int(data):
+        return int.from_bytes(bytes(data), 'little')
+
+    def _to_bytes(value, length):
+        return value.to_bytes(length, 'little')
+else:
+    def _to_int(data):
+        return int(binascii.hexlify(data[::-1]) or '0', 16)
+
+    def _to_bytes(value, length):
+        return binascii.unhexlify('%0*x' % (2 * length, value))[::-1]
+
+
+class Bitmap(object):
+    """Packed 1 bpp bitmap.
+
+    Coordinates are inclusive like in PIL's ImageDraw; anything outside
+    the bitmap is clipped.
+
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.stride = (width + 7) // 8
+        self.buffer = bytearray(self.stride * height)
+        self._ones = bytearray(b'\xff' * self.stride)
+        self._zeros = bytearray(self.stride)
+        self.top = 0
+        self.bottom = height
+
+    def mark_clean(self):
+        self.top = self.height
+        self.bottom = 0
+
+    def mark_dirty(self, top, bottom):
+        self.top = max(0, min(self.top, top))
+        self.bottom = min(self.height, max(self.bottom, bottom))
+
+    def fill(self, color=BLACK):
+        self.buffer[:] = (self._ones if color else self._zeros) * self.height
+        self.mark_dirty(0, self.height)
+
+    def clear(self):
+        self.fill(WHITE)
+
+    def get_row(self, y):
+        """Get row *y* as an integer, pixel x in bit x."""
+        offset = y * self.stride
+        return _to_int(self.buffer[offset:offset + self.stride])
+
+    def set_row(self, y, value):
+        """Set row *y* from an integer, pixel x in bit x."""
+        offset = y * self.stride
+        value &= (1 << self.width) - 1
+        self.buffer[offset:offset + self.stride] = _to_bytes(value, self.stride)
+        self.mark_dirty(y, y + 1)
+
+    def get_pixel(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return (self.buffer[y * self.stride + (x >> 3)] >> (x & 7)) & 1
+        return WHITE
+
+    def set_pixel(self, x, y, color=BLACK):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self._set(y * self.stride + (x >> 3), 1 << (x & 7), color)
+            self.mark_dirty(y, y + 1)
+
+    def _set(self, index, mask, color):
+        if color:
+            self.buffer[index] |= mask
+        else:
+            self.buffer[index] &= ~mask & 0xff
+
+    def _span(self, y, x0, x1, color):
+        # Sets pixels x0..x1 of row y, already clipped.
+        offset = y * self.stride
+        first, last = x0 >> 3, x1 >> 3
+        head = (0xff << (x0 & 7)) & 0xff
+        tail = 0xff >> (7 - (x1 & 7))
+        if first == last:
+            self._set(offset + first, head & tail, color)
+            return
+        self._set(offset + first, head, color)
+        self._set(offset + last, tail, color)
+        if last - first > 1:
+            self.buffer[offset + first + 1:offset + last] = \
+                (self._ones if color else self._zeros)[:last - first - 1]
+
+    def _clip_x(self, x0, x1):
+        if x0 > x1:
+            x0, x1 = x1, x0
+        return max(x0, 0), min(x1, self.width - 1)
+
+    def _clip_y(self, y0, y1):
+        if y0 > y1:
+            y0, y1 = y1, y0
+        return max(y0, 0), min(y1, self.height - 1)
+
+    def hline(self, x0, x1, y, color=BLACK):
+        x0, x1 = self._clip_x(x0, x1)
+        if 0 <= y < self.height and x0 <= x1:
+            self._span(y, x0, x1, color)
+            self.mark_dirty(y, y + 1)
+
+    def vline(self, x, y0, y1, color=BLACK):
+        y0, y1 = self._clip_y(y0, y1)
+        if 0 <= x < self.width and y0 <= y1:
+            mask = 1 << (x & 7)
+            for index in range(y0 * self.stride + (x >> 3), (y1 + 1) * self.stride, self.stride):
+                self._set(index, mask, color)
+            self.mark_dirty(y0, y1 + 1)
+
+    def line(self, x0, y0, x1, y1, color=BLACK):
+        if y0 == y1:
+            return self.hline(x0, x1, y0, color)
+        if x0 == x1:
+            return self.vline(x0, y0, y1, color)
+        # Bresenham
+        dx, dy = abs(x1 - x0), -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        error = dx + dy
+        x, y = x0, y0
+        while True:
+            if 0 <= x < self.width and 0 <= y < self.height:
+                self._set(y * self.stride + (x >> 3), 1 << (x & 7), color)
+            if x == x1 and y == y1:
+                break
+            double = 2 * error
+            if double >= dy:
+                error += dy
+                x += sx
+            if double <= dx:
+                error += dx
+                y += sy
+        top, bottom = self._clip_y(y0, y1)
+        self.mark_dirty(top, bottom + 1)
+
+    def rectangle(self, x0, y0, x1, y1, color=BLACK, fill=False):
+        if not fill:
+            self.hline(x0, x1, y0, color)
+            self.hline(x0, x1, y1, color)
+            self.vline(x0, y0, y1, color)
+            self.vline(x1, y0, y1, color)
+            return
+        x0, x1 = self._clip_x(x0, x1)
+        y0, y1 = self._clip_y(y0, y1)
+        if x0 > x1 or y0 > y1:
+            return
+        for y in range(y0, y1 + 1):
+            self._span(y, x0, x1, color)
+        self.mark_dirty(y0, y1 + 1)
+
+    def blit(self, source, x=0, y=0, transparent=False):
+        """Draw *source* with its top left corner at (x, y).
+
+        Args:
+            source (Bitmap): bitmap to copy.
+            transparent (bool): draw only the black pixels of *source*.
+
+        """
+        sx, sy = max(0, -x), max(0, -y)
+        x0, y0 = x + sx, y + sy
+        width = min(source.width - sx, self.width - x0)
+        height = min(source.height - sy, self.height - y0)
+        if width <= 0 or height <= 0:
+            return
+        first, last = x0 >> 3, ((x0 + width - 1) >> 3) + 1
+        src_first, src_last = sx >> 3, ((sx + width - 1) >> 3) + 1
+        if not transparent and not (x0 | sx) & 7 and not width & 7:
+            # Byte aligned, copy whole row slices.
+            for row in range(height):
+                src = (sy + row) * source.stride
+                dst = (y0 + row) * self.stride
+                self.buffer[dst + first:dst + last] = source.buffer[src + src_first:src + src_last]
+            self.mark_dirty(y0, y0 + height)
+            return
+        mask = (1 << width) - 1
+        shift = x0 & 7
+        keep = ~(mask << shift)
+        for row in range(height):
+            src = (sy + row) * source.stride
+            bits = (_to_int(source.buffer[src + src_first:src + src_last]) >> (sx & 7)) & mask
+            if not bits and transparent:
+                continue
+            dst = (y0 + row) * self.stride
+            value = _to_int(self.buffer[dst + first:dst + last])
+            if transparent:
+                value |= bits << shift
+            else:
+                value = (value & keep) | (bits << shift)
+            self.buffer[dst + first:dst + last] = _to_bytes(value, last - first)
+        self.mark_dirty(y0, y0 + height)
+
+    def to_image(self):
+        """Convert to a PIL image in mode '1'."""
+        import Image
+        return Image.fromstring('1', (self.width, self.height),
+                                bytes(self.buffer).translate(PIL_TRANSLATION))
+
+    @classmethod
+    def from_image(cls, image):
+        """Convert a PIL image; it is converted to mode '1' first."""
+        if image.mode != '1':
+            image = image.convert('1')
+        bitmap = cls(image.size[0], image.size[1])
+        bitmap.buffer[:] = image.tostring().translate(PIL_TRANSLATION)
+        return bitmap
@@ -0,0 +1,71 @@
+"""Scrolling strip chart drawn into a bitmap.Bitmap.
+
+The chart keeps its plot in a bitmap used as a circular buffer of
+columns: adding a sample only redraws the column at the write offset and
+advances the offset, so its cost does not depend on the chart width.
+draw() rotates each row by the offset while copying, leaving the newest
+sample at the right edge.
+
+Simple usage:
+    >>> from ev3.rawdevice import chart, lcd
+    >>> screen = lcd.new_bitmap()
+    >>> plot = chart.StripChart(178, 100, 0, 100)
+    >>> while True:
+    ...     plot.add(sensor.get_distance())
+    ...     plot.draw(screen, 0, 28)
+    ...     lcd.show(screen)
+
+"""
+from .bitmap import Bitmap, BLACK, WHITE
+
+
+class StripChart(object):
+    """Plot of the last *width* samples scaled from *minimum*..*maximum*.
+
+    Args:
+        width (int): number of samples (columns) shown.
+        height (int): height in pixels.
+        minimum: value drawn on the bottom row.
+        maximum: value drawn on the top row; values outside the range
+            are clipped.
+
+    """
+
+    def __init__(self, width, height, minimum, maximum):
+        self.width = width
+        self.height = height
+        self.minimum = minimum
+        self.maximum = maximum
+        self.head = 0
+        self._columns = Bitmap(width, height)
+        self._view = Bitmap(width, height)
+        self._mask = (1 << width) - 1
+        self._last = None
+
+    def _scale(self, value):
+        span = self.maximum - self.minimum
+        y = self.height - 1 - int(round((value - self.minimum) * (self.height - 1.0) / span))
+        return min(max(y, 0), self.height - 1)
+
+    def add(self, value):
+        """Append a sample, dropping the oldest one once the chart is full."""
+        y = self._scale(value)
+        columns = self._columns
+        columns.vline(self.head, 0, self.height - 1, WHITE)
+        # Join to the previous sample so steep changes stay visible.
+        columns.vline(self.head, y, y if self._last is None else self._last, BLACK)
+        self._last = y
+        self.head = (self.head + 1) % self.width
+
+    def clear(self):
+        self._columns.clear()
+        self.head = 0
+        self._last = None
+
+    def draw(self, target, x, y):
+        """Draw the chart, oldest sample on the left, into bitmap *target*."""
+        head, tail = self.head, self.width - self.head
+        for row in range(self.height):
+            bits = self._columns.get_row(row)
+            self._view.set_row(row, (bits >> head) | ((bits << tail) & self._mask))
+        target.blit(self._view, x, y)
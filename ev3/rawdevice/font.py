@@ -0,0 +1,159 @@
+"""Bitmap fonts for drawing text into a bitmap.Bitmap.
+
+Glyphs are rasterized once into packed rows; a string is rendered by
+or-ing the glyph rows together at their offsets, and the last rendered
+strings are kept, so redrawing a readout that did not change costs a
+single blit.
+
+Simple usage:
+    >>> from ev3.rawdevice import font, lcd
+    >>> screen = lcd.new_bitmap()
+    >>> font.DEFAULT.draw(screen, 0, 0, 'Speed: %3d' % 42)
+    >>> lcd.show(screen)
+
+"""
+from collections import OrderedDict
+from .bitmap import Bitmap
+
+# 5x7 ASCII font, characters 32-126. One byte per column, top row in the
+# least significant bit.
+_COLUMNS_5X7 = (
+    0x00, 0x00, 0x00, 0x00, 0x00,  0x00, 0x00, 0x5F, 0x00, 0x00,
+    0x00, 0x07, 0x00, 0x07, 0x00,  0x14, 0x7F, 0x14, 0x7F, 0x14,
+    0x24, 0x2A, 0x7F, 0x2A, 0x12,  0x23, 0x13, 0x08, 0x64, 0x62,
+    0x36, 0x49, 0x55, 0x22, 0x50,  0x00, 0x05, 0x03, 0x00, 0x00,
+    0x00, 0x1C, 0x22, 0x41, 0x00,  0x00, 0x41, 0x22, 0x1C, 0x00,
+    0x08, 0x2A, 0x1C, 0x2A, 0x08,  0x08, 0x08, 0x3E, 0x08, 0x08,
+    0x00, 0x50, 0x30, 0x00, 0x00,  0x08, 0x08, 0x08, 0x08, 0x08,
+    0x00, 0x60, 0x60, 0x00, 0x00,  0x20, 0x10, 0x08, 0x04, 0x02,
+    0x3E, 0x51, 0x49, 0x45, 0x3E,  0x00, 0x42, 0x7F, 0x40, 0x00,
+    0x42, 0x61, 0x51, 0x49, 0x46,  0x21, 0x41, 0x45, 0x4B, 0x31,
+    0x18, 0x14, 0x12, 0x7F, 0x10,  0x27, 0x45, 0x45, 0x45, 0x39,
+    0x3C, 0x4A, 0x49, 0x49, 0x30,  0x01, 0x71, 0x09, 0x05, 0x03,
+    0x36, 0x49, 0x49, 0x49, 0x36,  0x06, 0x49, 0x49, 0x29, 0x1E,
+    0x00, 0x36, 0x36, 0x00, 0x00,  0x00, 0x56, 0x36, 0x00, 0x00,
+    0x08, 0x14, 0x22, 0x41, 0x00,  0x14, 0x14, 0x14, 0x14, 0x14,
+    0x00, 0x41, 0x22, 0x14, 0x08,  0x02, 0x01, 0x51, 0x09, 0x06,
+    0x32, 0x49, 0x79, 0x41, 0x3E,  0x7E, 0x11, 0x11, 0x11, 0x7E,
+    0x7F, 0x49, 0x49, 0x49, 0x36,  0x3E, 0x41, 0x41, 0x41, 0x22,
+    0x7F, 0x41, 0x41, 0x22, 0x1C,  0x7F, 0x49, 0x49, 0x49, 0x41,
+    0x7F, 0x09, 0x09, 0x01, 0x01,  0x3E, 0x41, 0x41, 0x51, 0x32,
+    0x7F, 0x08, 0x08, 0x08, 0x7F,  0x00, 0x41, 0x7F, 0x41, 0x00,
+    0x20, 0x40, 0x41, 0x3F, 0x01,  0x7F, 0x08, 0x14, 0x22, 0x41,
+    0x7F, 0x40, 0x40, 0x40, 0x40,  0x7F, 0x02, 0x04, 0x02, 0x7F,
+    0x7F, 0x04, 0x08, 0x10, 0x7F,  0x3E, 0x41, 0x41, 0x41, 0x3E,
+    0x7F, 0x09, 0x09, 0x09, 0x06,  0x3E, 0x41, 0x51, 0x21, 0x5E,
+    0x7F, 0x09, 0x19, 0x29, 0x46,  0x46, 0x49, 0x49, 0x49, 0x31,
+    0x01, 0x01, 0x7F, 0x01, 0x01,  0x3F, 0x40, 0x40, 0x40, 0x3F,
+    0x1F, 0x20, 0x40, 0x20, 0x1F,  0x7F, 0x20, 0x18, 0x20, 0x7F,
+    0x63, 0x14, 0x08, 0x14, 0x63,  0x03, 0x04, 0x78, 0x04, 0x03,
+    0x61, 0x51, 0x49, 0x45, 0x43,  0x00, 0x00, 0x7F, 0x41, 0x41,
+    0x02, 0x04, 0x08, 0x10, 0x20,  0x41, 0x41, 0x7F, 0x00, 0x00,
+    0x04, 0x02, 0x01, 0x02, 0x04,  0x40, 0x40, 0x40, 0x40, 0x40,
+    0x00, 0x01, 0x02, 0x04, 0x00,  0x20, 0x54, 0x54, 0x54, 0x78,
+    0x7F, 0x48, 0x44, 0x44, 0x38,  0x38, 0x44, 0x44, 0x44, 0x20,
+    0x38, 0x44, 0x44, 0x48, 0x7F,  0x38, 0x54, 0x54, 0x54, 0x18,
+    0x08, 0x7E, 0x09, 0x01, 0x02,  0x08, 0x14, 0x54, 0x54, 0x3C,
+    0x7F, 0x08, 0x04, 0x04, 0x78,  0x00, 0x44, 0x7D, 0x40, 0x00,
+    0x20, 0x40, 0x44, 0x3D, 0x00,  0x00, 0x7F, 0x10, 0x28, 0x44,
+    0x00, 0x41, 0x7F, 0x40, 0x00,  0x7C, 0x04, 0x18, 0x04, 0x78,
+    0x7C, 0x08, 0x04, 0x04, 0x78,  0x38, 0x44, 0x44, 0x44, 0x38,
+    0x7C, 0x14, 0x14, 0x14, 0x08,  0x08, 0x14, 0x14, 0x18, 0x7C,
+    0x7C, 0x08, 0x04, 0x04, 0x08,  0x48, 0x54, 0x54, 0x54, 0x20,
+    0x04, 0x3F, 0x44, 0x40, 0x20,  0x3C, 0x40, 0x40, 0x20, 0x7C,
+    0x1C, 0x20, 0x40, 0x20, 0x1C,  0x3C, 0x40, 0x30, 0x40, 0x3C,
+    0x44, 0x28, 0x10, 0x28, 0x44,  0x0C, 0x50, 0x50, 0x50, 0x3C,
+    0x44, 0x64, 0x54, 0x4C, 0x44,  0x00, 0x08, 0x36, 0x41, 0x00,
+    0x00, 0x00, 0x7F, 0x00, 0x00,  0x00, 0x41, 0x36, 0x08, 0x00,
+    0x10, 0x08, 0x08, 0x10, 0x08,
+)
+
+
+class Font(object):
+    """Fixed height font made of pre-rasterized glyphs.
+
+    Args:
+        glyphs (dict): character -> (width, rows), rows being one integer
+            per pixel row with pixel x in bit x.
+        height (int): rows per glyph.
+        spacing (int): blank columns after each glyph.
+        cache_size (int): number of rendered strings to keep.
+
+    """
+
+    def __init__(self, glyphs, height, spacing=1, cache_size=32):
+        self.glyphs = glyphs
+        self.height = height
+        self.spacing = spacing
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._missing = glyphs.get('?') or (0, (0,) * height)
+
+    @classmethod
+    def from_columns(cls, first, columns, width, height, **kwargs):
+        """Build a font from column bytes (top row in bit 0), *width* per glyph."""
+        glyphs = {}
+        for index in range(len(columns) // width):
+            glyph = columns[index * width:(index + 1) * width]
+            rows = tuple(sum(1 << x for x, column in enumerate(glyph) if column >> y & 1)
+                         for y in range(height))
+            glyphs[chr(first + index)] = (width, rows)
+        return cls(glyphs, height, **kwargs)
+
+    @classmethod
+    def from_pil(cls, pil_font, characters=None, **kwargs):
+        """Rasterize a PIL ImageFont once."""
+        import Image
+        import ImageDraw
+        if characters is None:
+            characters = [chr(code) for code in range(32, 127)]
+        height = max(pil_font.getsize(c)[1] for c in characters)
+        glyphs = {}
+        for c in characters:
+            width = max(pil_font.getsize(c)[0], 1)
+            image = Image.new('1', (width, height), 1)
+            ImageDraw.Draw(image).text((0, 0), c, font=pil_font, fill=0)
+            bitmap = Bitmap.from_image(image)
+            glyphs[c] = (width, tuple(bitmap.get_row(y) for y in range(height)))
+        kwargs.setdefault('spacing', 0)
+        return cls(glyphs, height, **kwargs)
+
+    def get_width(self, text):
+        return sum(self.glyphs.get(c, self._missing)[0] + self.spacing for c in text)
+
+    def render(self, text):
+        """Get *text* as a Bitmap; it is shared with later calls, do not draw on it."""
+        bitmap = self._cache.pop(text, None)
+        if bitmap is None:
+            bitmap = self._render(text)
+            if len(self._cache) >= self.cache_size:
+                self._cache.popitem(last=False)
+        self._cache[text] = bitmap
+        return bitmap
+
+    def _render(self, text):
+        rows = [0] * self.height
+        x = 0
+        for c in text:
+            width, glyph = self.glyphs.get(c, self._missing)
+            for y in range(self.height):
+                rows[y] |= glyph[y] << x
+            x += width + self.spacing
+        bitmap = Bitmap(max(x, 1), self.height)
+        for y in range(self.height):
+            bitmap.set_row(y, rows[y])
+        return bitmap
+
+    def draw(self, target, x, y, text, transparent=False):
+        """Draw *text* into bitmap *target* with its top left corner at (x, y).
+
+        Returns:
+            int. Width of the text in pixels.
+
+        """
+        bitmap = self.render(text)
+        target.blit(bitmap, x, y, transparent)
+        return bitmap.width
+
+
+DEFAULT = Font.from_columns(32, _COLUMNS_5X7, 5, 7)
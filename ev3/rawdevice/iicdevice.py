@@ -1,10 +1,10 @@
 import os
 import time
-import datetime
+import threading
 from fcntl import ioctl
-from ctypes import sizeof
+from ctypes import addressof, c_char, memmove, sizeof
 from mmap import mmap, MAP_SHARED, PROT_READ, PROT_WRITE
-from . import dcm, lms2012, lms2012extra
+from . import analogdevice, dcm, get_devcon, lms2012, lms2012extra, poll
 
 INPUT_DEVICE_NUMBER = 4
 OUTPUT_DEVICE_NUMBER = 4
@@ -14,13 +14,22 @@ _iicfile = None
 _iicmm = None
 _iic = None
 _devcon = None
+# Transaction the driver is currently repeating on each port, see
+# Transaction.start_polling().
+_polled = [None] * INPUT_DEVICE_NUMBER
+# The driver keeps one transaction per port: held while a port's
+# transaction, poll or reset is in progress, by callers and by the
+# iicexecutor workers alike.
+_port_locks = [threading.RLock() for _ in range(INPUT_DEVICE_NUMBER)]
+# Identity registers per (port, address), see read_identity().
+_identity = {}
 
 
 def open_device():
     global _initialized
     if not _initialized:
         global _devcon
-        from . import devcon as _devcon
+        _devcon = get_devcon()
         global _iicfile
         _iicfile = os.open(lms2012.IIC_DEVICE_NAME, os.O_RDWR)
         global _iicmm
@@ -39,42 +48,204 @@ def set_operating_mode(port, typ, mode):
 
 
 def reset(port):
-    dcm.set_pin_mode(port, 'f')
-    time.sleep(0.1)
-    _devcon.Connection[port] = lms2012.CONN_NONE
-    _devcon.Type[port] = 0
-    _devcon.Mode[port] = 0
-    ioctl(_iicfile, lms2012extra.IIC_SET_CONN, _devcon)
-    time.sleep(0.1)
-    set_operating_mode(port, lms2012.TYPE_IIC_UNKNOWN, 255)
-    time.sleep(0.1)
-    set_operating_mode(port, lms2012.TYPE_IIC_UNKNOWN, 255)
+    with _port_locks[port]:
+        _polled[port] = None
+        clear_identity(port)
+        dcm.set_pin_mode(port, 'f')
+        time.sleep(0.1)
+        _devcon.Connection[port] = lms2012.CONN_NONE
+        _devcon.Type[port] = 0
+        _devcon.Mode[port] = 0
+        ioctl(_iicfile, lms2012extra.IIC_SET_CONN, _devcon)
+        time.sleep(0.1)
+        set_operating_mode(port, lms2012.TYPE_IIC_UNKNOWN, 255)
+        time.sleep(0.1)
+        set_operating_mode(port, lms2012.TYPE_IIC_UNKNOWN, 255)
+
+
+def _setup(iicdata, port, deviceAddress, writeBuf, readLen):
+    iicdata.Port = port
+    iicdata.Result = -1
+    iicdata.Repeat = 1
+    iicdata.Time = 0
+    iicdata.WrLng = len(writeBuf) + 1
+    iicdata.WrData[1:len(writeBuf) + 1] = list(writeBuf)
+    iicdata.WrData[0] = deviceAddress >> 1
+    iicdata.RdLng = -readLen
+
+
+def _end_polling(port):
+    # Stops the driver repeating a Transaction.start_polling() request.
+    if _polled[port] is not None:
+        _polled[port] = None
+        set_operating_mode(port, lms2012.TYPE_IIC_UNKNOWN, 255)
 
 
 def i2c_transaction(port, deviceAddress, writeBuf, readLen):
         iicdata = lms2012.IICDAT()
-        iicdata.Port = port
-        iicdata.Result = -1
-        iicdata.Repeat = 1
-        iicdata.Time = 0
-        iicdata.WrLng = len(writeBuf) + 1
-        iicdata.WrData[1:len(writeBuf) + 1] = writeBuf[:]
-        iicdata.WrData[0] = deviceAddress >> 1
-        iicdata.RdLng = -readLen
-        timeout = datetime.datetime.now() + datetime.timedelta(seconds=1)
-        while True:
+        _setup(iicdata, port, deviceAddress, writeBuf, readLen)
+
+        def attempt():
             ioctl(_iicfile, lms2012extra.IIC_SETUP, iicdata)
-            #status = iicdata.Result
             if (iicdata.Result == 0):
                 return iicdata.RdData[:readLen]
-            if datetime.datetime.now() > timeout:
-                break
-            time.sleep(0.01)
+
+        with _port_locks[port]:
+            _end_polling(port)
+            return poll.until(attempt, 1, 'iic transaction', 0.01)
+
+
+class Transaction(object):
+    """I2C transaction prepared once and executed any number of times.
+
+    The IICDAT request is built in the constructor; execute() only resets
+    its result, runs the ioctl and copies the read bytes (unsigned) into a
+    bytearray owned by the caller or by the transaction.
+
+    After start_polling() the driver repeats the transaction by itself and
+    execute() copies the latest result out of the IIC mmap without a
+    syscall. The driver repeats one transaction per port, so polling stops
+    as soon as any other transaction is run on the same port.
+
+    """
+
+    def __init__(self, port, deviceAddress, writeBuf, readLen):
+        self.port = port
+        self.read_length = readLen
+        self.buffer = bytearray(readLen)
+        self._poll_bytes = [deviceAddress >> 1] + list(writeBuf)
+        self._iicdata = lms2012.IICDAT()
+        _setup(self._iicdata, port, deviceAddress, writeBuf, readLen)
+        self._rddata = addressof(self._iicdata) + lms2012.IICDAT.RdData.offset
+        self._buffer_address = self._address(self.buffer)
+
+    def _address(self, buf):
+        return addressof((c_char * self.read_length).from_buffer(buf)) if self.read_length else 0
+
+    @property
+    def polling(self):
+        return _polled[self.port] is self
+
+    def start_polling(self, period=10):
+        """Let the driver repeat the transaction every *period* ms (10-1000).
+
+        The poll is registered with IIC_SET, which is what fills the IIC
+        ring and raises IIC_DATA_READY; the poll string holds the device
+        address and at most three register bytes.
+
+        Returns:
+            bool. True once the first result arrived.
+
+        """
+        if len(self._poll_bytes) > 4:
+            raise ValueError('IIC poll string is limited to 3 register bytes')
+        iicstr = lms2012.IICSTR()
+        iicstr.Port = self.port
+        iicstr.Time = period
+        iicstr.Type = lms2012.TYPE_IIC_UNKNOWN
+        iicstr.Mode = 0
+        iicstr.SetupLng = 0
+        iicstr.SetupString = 0
+        iicstr.PollLng = len(self._poll_bytes)
+        iicstr.PollString = reduce(lambda value, byte: value << 8 | byte, self._poll_bytes, 0)
+        iicstr.ReadLng = self.read_length
+        with _port_locks[self.port]:
+            _polled[self.port] = None
+            _iic.Status[self.port] = _iic.Status[self.port] & ~ lms2012.IIC_DATA_READY
+            ioctl(_iicfile, lms2012extra.IIC_SET, iicstr)
+            if poll.until(self._data_ready, 1, 'iic start polling', 0.01) is None:
+                set_operating_mode(self.port, lms2012.TYPE_IIC_UNKNOWN, 255)
+                return False
+            _polled[self.port] = self
+            return True
+
+    def stop_polling(self):
+        with _port_locks[self.port]:
+            if self.polling:
+                _end_polling(self.port)
+
+    def _data_ready(self):
+        if _iic.Status[self.port] & lms2012.IIC_DATA_READY:
+            return True
+
+    def _attempt(self):
+        ioctl(_iicfile, lms2012extra.IIC_SETUP, self._iicdata)
+        if (self._iicdata.Result == 0):
+            return True
+
+    def execute(self, into=None):
+        """Run the transaction.
+
+        Args:
+            into (bytearray): receives the read bytes; defaults to *buffer*.
+
+        Returns:
+            bytearray. *into*, or None on timeout.
+
+        """
+        if into is None:
+            into, address = self.buffer, self._buffer_address
+        else:
+            address = self._address(into)
+        if _polled[self.port] is self:
+            source = addressof(_iic) + lms2012.IIC.Raw.offset + \
+                (self.port * lms2012.DEVICE_LOGBUF_SIZE + _iic.Actual[self.port]) * \
+                lms2012.IIC_DATA_LENGTH
+            memmove(address, source, self.read_length)
+            return into
+        with _port_locks[self.port]:
+            _end_polling(self.port)
+            self._iicdata.Result = -1
+            if self._attempt() is None and \
+                    poll.until(self._attempt, 1, 'iic transaction', 0.01) is None:
+                return None
+            memmove(address, self._rddata, self.read_length)
+        return into
+
+
+def _connection(port):
+    if analogdevice._initialized:
+        return analogdevice.get_connection_type(port)
+    return None
+
+
+# Reads registers that do not change while a device stays plugged in
+# (version, vendor, device id). The result is kept until the port is
+# reset or the analog driver reports a different connection type.
+def read_identity(port, deviceAddress, register, readLen=8):
+    connection = _connection(port)
+    entry = _identity.get((port, deviceAddress))
+    if entry is None or entry[0] != connection:
+        entry = _identity[(port, deviceAddress)] = (connection, {})
+    values = entry[1]
+    value = values.get((register, readLen))
+    if value is None:
+        value = i2c_transaction(port, deviceAddress, [register], readLen)
+        if value is None:
+            return None
+        values[(register, readLen)] = value
+    return list(value)
+
+
+def clear_identity(port=None):
+    for key in list(_identity):
+        if port is None or key[0] == port:
+            del _identity[key]
+
+
+def get_value_bytes(port):
+    return _iic.Raw[port][_iic.Actual[port]]
+
+
+def get_iic():
+    return _iic
 
 
 def close_device():
     global _initialized
     if _initialized:
+        _polled[:] = [None] * INPUT_DEVICE_NUMBER
+        clear_identity()
         _iicmm.close()
         os.close(_iicfile)
         _initialized = False
@@ -0,0 +1,176 @@
+"""Runs I2C transactions on one worker thread per input port.
+
+A transaction blocks its caller for as long as the sensor takes to
+answer, up to the one second retry window. Submitting it here returns a
+Future at once; each port has its own worker, so a slow sensor only
+delays transactions queued on its own port. A worker takes everything
+queued on its port in one batch, and identical reads following each
+other in a batch are run once and share the result.
+
+Simple usage:
+    >>> from ev3.rawdevice import iicexecutor
+    >>> angle = iicexecutor.read(ev3.SENSOR_1, 0x02, [0x44], 2)
+    >>> distance = iicexecutor.read(ev3.SENSOR_4, 0x02, [0x42], 2)
+    >>> angle.result(), distance.result()
+
+"""
+import threading
+from collections import deque
+from . import iicdevice
+
+INPUT_DEVICE_NUMBER = 4
+
+_workers = [None] * INPUT_DEVICE_NUMBER
+_lock = threading.Lock()
+
+
+class Future(object):
+    """Result of a transaction run by a worker."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    def done(self):
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """Wait for the transaction and return its result.
+
+        Raises:
+            The exception raised by the transaction, or RuntimeError if
+            *timeout* seconds passed first.
+
+        """
+        if not self._event.wait(timeout):
+            raise RuntimeError('i2c transaction still pending')
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self, timeout=None):
+        if not self._event.wait(timeout):
+            raise RuntimeError('i2c transaction still pending')
+        return self._exception
+
+    def add_done_callback(self, fn):
+        """Call fn(future) once done, on the worker thread."""
+        with _lock:
+            if not self._event.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def _finish(self, result, exception):
+        self._result = result
+        self._exception = exception
+        with _lock:
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn(self)
+
+    def set_result(self, result):
+        self._finish(result, None)
+
+    def set_exception(self, exception):
+        self._finish(None, exception)
+
+
+class _Worker(threading.Thread):
+
+    def __init__(self, port):
+        threading.Thread.__init__(self, name='iic-port-%d' % port)
+        self.daemon = True
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._running = True
+
+    def submit(self, key, func, args):
+        future = Future()
+        with self._condition:
+            if not self._running:
+                raise RuntimeError('i2c executor is shut down')
+            self._queue.append((key, func, args, future))
+            self._condition.notify()
+        return future
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+            self._run_batch(batch)
+
+    def _run_batch(self, batch):
+        # Reads are keyed by their request; commands have no key and end
+        # the run of reads that may share a result.
+        done = {}
+        for key, func, args, future in batch:
+            if key is not None and key in done:
+                result, exception = done[key]
+            else:
+                result = exception = None
+                try:
+                    result = func(*args)
+                except Exception as e:
+                    exception = e
+                if key is None:
+                    done.clear()
+                else:
+                    done[key] = (result, exception)
+            future._finish(result, exception)
+
+
+def _get_worker(port):
+    with _lock:
+        worker = _workers[port]
+        if worker is None:
+            worker = _workers[port] = _Worker(port)
+            worker.start()
+    return worker
+
+
+def submit(port, func, *args):
+    """Run func(*args) on the worker of *port*.
+
+    Returns:
+        Future.
+
+    """
+    return _get_worker(port).submit(None, func, args)
+
+
+def read(port, deviceAddress, writeBuf, readLen):
+    """Queue iicdevice.i2c_transaction() reading *readLen* bytes.
+
+    Returns:
+        Future.
+
+    """
+    key = (deviceAddress, tuple(writeBuf), readLen)
+    return _get_worker(port).submit(
+        key, iicdevice.i2c_transaction, (port, deviceAddress, writeBuf, readLen))
+
+
+def shutdown(wait=True):
+    """Stop all workers once they ran what is already queued."""
+    with _lock:
+        workers = [worker for worker in _workers if worker is not None]
+        _workers[:] = [None] * INPUT_DEVICE_NUMBER
+    for worker in workers:
+        worker.stop()
+    if wait:
+        for worker in workers:
+            worker.join()
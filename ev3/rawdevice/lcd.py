@@ -1,46 +1,312 @@
 import os
-import array
+import time
+import threading
+import traceback
+from fcntl import ioctl
+from ctypes import Structure, c_char, c_uint16, c_uint32, c_ulong
 from mmap import mmap, MAP_SHARED, PROT_READ, PROT_WRITE
-from . import lms2012
-import Image
-import ImageDraw
+from . import bitmap, lms2012, poll
 _initialized = False
 MEM_WIDTH = 60  # bytes
 SCREEN_WIDTH = 178  # pix
 SCREEN_HEIGHT = 128
 HW_MEM_WIDTH = ((SCREEN_WIDTH + 31)/32)*4
+FBIOGET_FSCREENINFO = 0x4602
 _lcdfile = None
 lcdmm=None
-image = Image.new('1',(HW_MEM_WIDTH*8,SCREEN_HEIGHT),1)
-draw=ImageDraw.Draw(image)
+# Bytes per framebuffer row as reported by the driver; HW_MEM_WIDTH, the
+# stride the screen was always written with, when it cannot be queried.
+_line_length = HW_MEM_WIDTH
+# PIL canvas and its ImageDraw, created by open_device() when PIL is
+# installed and otherwise None, so the bitmap path works without PIL.
+image = None
+draw = None
+# PIL mode '1' byte -> framebuffer byte: inverted (1 is black) and with
+# the leftmost pixel in the least significant bit.
+_DEVICE_BYTES = bitmap.PIL_TRANSLATION
+# PIL bytes of the frame on screen (bytearray), None when the screen
+# content is unknown.
+_shown = None
+# Hold while drawing into *image* if the compositor runs, so it never
+# copies a half drawn frame.
+lock = threading.RLock()
+# Serializes copies to lcdmm and every use of _shown between the caller
+# and the compositor thread.
+_screen_lock = threading.Lock()
+_compositor = None
+
+
+class _FixScreenInfo(Structure):
+    # struct fb_fix_screeninfo from linux/fb.h
+    _fields_ = [('id', c_char * 16),
+                ('smem_start', c_ulong),
+                ('smem_len', c_uint32),
+                ('type', c_uint32),
+                ('type_aux', c_uint32),
+                ('visual', c_uint32),
+                ('xpanstep', c_uint16),
+                ('ypanstep', c_uint16),
+                ('ywrapstep', c_uint16),
+                ('line_length', c_uint32),
+                ('mmio_start', c_ulong),
+                ('mmio_len', c_uint32),
+                ('accel', c_uint32),
+                ('capabilities', c_uint16),
+                ('reserved', c_uint16 * 2)]
+
+
+def _query_line_length(fd):
+    info = _FixScreenInfo()
+    try:
+        ioctl(fd, FBIOGET_FSCREENINFO, info)
+    except IOError:
+        return HW_MEM_WIDTH
+    return info.line_length or HW_MEM_WIDTH
+
+
 def open_device():
     global _initialized
     if not _initialized:
         global _lcdfile
         _lcdfile = os.open(lms2012.LCD_DEVICE_NAME, os.O_RDWR)
+        global _line_length
+        _line_length = _query_line_length(_lcdfile)
         global lcdmm
-        lcdmm = mmap(fileno=_lcdfile, length=MEM_WIDTH * SCREEN_HEIGHT,
+        lcdmm = mmap(fileno=_lcdfile, length=_line_length * SCREEN_HEIGHT,
                      flags=MAP_SHARED, prot=PROT_READ | PROT_WRITE, offset=0)
+        try:
+            _create_image()
+        except ImportError:
+            pass
+        invalidate()
     _initialized = True
 
+
+def _create_image():
+    global image, draw
+    if image is None:
+        import Image
+        import ImageDraw
+        image = Image.new('1',(HW_MEM_WIDTH*8,SCREEN_HEIGHT),1)
+        draw=ImageDraw.Draw(image)
+
+
+def get_image():
+    """Return the PIL canvas shown by redraw(), creating it if needed."""
+    _create_image()
+    return image
+
+
+def get_draw():
+    """Return the ImageDraw of get_image()."""
+    _create_image()
+    return draw
+
 def black():
-    draw.rectangle([0,0,SCREEN_WIDTH-1,SCREEN_HEIGHT-1],fill=0)
+    with lock:
+        get_draw().rectangle([0,0,SCREEN_WIDTH-1,SCREEN_HEIGHT-1],fill=0)
     redraw()
 
 def white():
-    draw.rectangle([0,0,SCREEN_WIDTH-1,SCREEN_HEIGHT-1],fill=1)
+    with lock:
+        get_draw().rectangle([0,0,SCREEN_WIDTH-1,SCREEN_HEIGHT-1],fill=1)
     redraw()
 
-def redraw():
-    reversbuffer=array.array('B',[int('{:08b}'.format(~ord(c)&0xff)[::-1], 2) for c in image.tostring()])
-    lcdmm.seek(0)
-    lcdmm.write(reversbuffer)
+def invalidate():
+    """Make the next redraw() copy the whole screen."""
+    global _shown
+    with _screen_lock:
+        _shown = None
+
+
+def _changed_rows(frame, shown, top, bottom):
+    # Yields (top, bottom) runs of rows which differ from what is shown.
+    if shown is None:
+        yield top, bottom
+        return
+    start = None
+    for y in range(top, bottom):
+        offset = y * HW_MEM_WIDTH
+        if frame[offset:offset + HW_MEM_WIDTH] != shown[offset:offset + HW_MEM_WIDTH]:
+            if start is None:
+                start = y
+        elif start is not None:
+            yield start, y
+            start = None
+    if start is not None:
+        yield start, bottom
+
+
+def redraw(top=0, bottom=SCREEN_HEIGHT):
+    """Copy the rows of *image* which changed since the last redraw.
+
+    While the compositor runs this only requests a frame and returns.
+
+    Args:
+        top, bottom (int): limit the comparison to these rows when the
+        caller knows that nothing else was drawn.
+
+    """
+    compositor = _compositor
+    if compositor is not None:
+        compositor.request(top, bottom)
+        return
+    with lock:
+        frame = get_image().tostring()
+    _flush(frame, top, bottom)
+
+
+def _flush(frame, top, bottom):
+    with _screen_lock:
+        _flush_locked(frame, top, bottom)
+
+
+def _flush_locked(frame, top, bottom):
+    global _shown
+    if frame == _shown:
+        return
+    if _shown is None:
+        top, bottom = 0, SCREEN_HEIGHT
+        _shown = bytearray(frame)
+        shown = None
+    else:
+        shown = _shown
+    width = min(HW_MEM_WIDTH, _line_length)
+    for start, end in _changed_rows(frame, shown, top, bottom):
+        rows = frame[start * HW_MEM_WIDTH:end * HW_MEM_WIDTH].translate(_DEVICE_BYTES)
+        if _line_length == HW_MEM_WIDTH:
+            lcdmm[start * HW_MEM_WIDTH:end * HW_MEM_WIDTH] = rows
+            continue
+        source = 0
+        for target in range(start * _line_length, end * _line_length, _line_length):
+            lcdmm[target:target + width] = rows[source:source + width]
+            source += HW_MEM_WIDTH
     lcdmm.flush()
+    # Only the scanned rows are known to be on screen now.
+    _shown[top * HW_MEM_WIDTH:bottom * HW_MEM_WIDTH] = frame[top * HW_MEM_WIDTH:bottom * HW_MEM_WIDTH]
+
+
+def new_bitmap():
+    """Create a screen sized bitmap.Bitmap for drawing without PIL."""
+    return bitmap.Bitmap(SCREEN_WIDTH, SCREEN_HEIGHT)
+
+
+def draw_text(screen, x, y, text, text_font=None):
+    """Draw *text* into a bitmap.Bitmap using cached glyphs.
+
+    Args:
+        text_font (font.Font): defaults to the built-in 5x7 font.
+
+    Returns:
+        int. Width of the text in pixels.
+
+    """
+    if text_font is None:
+        from . import font
+        text_font = font.DEFAULT
+    return text_font.draw(screen, x, y, text)
+
+
+def show(screen):
+    """Copy the rows of a bitmap.Bitmap changed since its last show().
+
+    The bitmap is already in framebuffer format, so rows are copied as
+    they are. The next redraw() of *image* copies the whole screen.
+
+    """
+    global _shown
+    width = min(screen.stride, _line_length)
+    with _screen_lock:
+        if screen.top < screen.bottom:
+            if width == screen.stride == _line_length:
+                start, end = screen.top * width, screen.bottom * width
+                lcdmm[start:end] = bytes(screen.buffer[start:end])
+            else:
+                source = screen.top * screen.stride
+                for target in range(screen.top * _line_length, screen.bottom * _line_length, _line_length):
+                    lcdmm[target:target + width] = bytes(screen.buffer[source:source + width])
+                    source += screen.stride
+            lcdmm.flush()
+        _shown = None
+    screen.mark_clean()
+
+
+class _Compositor(threading.Thread):
+
+    def __init__(self, max_fps):
+        threading.Thread.__init__(self, name='lcd-compositor')
+        self.daemon = True
+        self._interval = 1.0 / max_fps
+        self._requested = threading.Event()
+        self._rows = None
+        self._rows_lock = threading.Lock()
+        self._running = True
+
+    def request(self, top, bottom):
+        with self._rows_lock:
+            if self._rows is None:
+                self._rows = (top, bottom)
+            else:
+                self._rows = (min(top, self._rows[0]), max(bottom, self._rows[1]))
+        self._requested.set()
+
+    def stop(self):
+        self._running = False
+        self._requested.set()
+
+    def run(self):
+        while True:
+            self._requested.wait()
+            if not self._running:
+                break
+            start = poll.monotonic()
+            self._requested.clear()
+            with self._rows_lock:
+                top, bottom = self._rows
+                self._rows = None
+            # The copy taken under the lock is the front buffer; drawing
+            # goes on in *image* while it is converted and written.
+            try:
+                with lock:
+                    frame = get_image().tostring()
+                _flush(frame, top, bottom)
+            except Exception:
+                # Keep serving requests; the next frame is copied whole.
+                traceback.print_exc()
+                invalidate()
+            # Requests made until the next frame is due are coalesced.
+            delay = self._interval - (poll.monotonic() - start)
+            if delay > 0:
+                time.sleep(delay)
+
+
+def start_compositor(max_fps=20):
+    """Refresh the screen from a background thread.
+
+    redraw() then returns at once and the thread copies the latest
+    state of *image* at most *max_fps* times per second. Draw while
+    holding *lock* to keep the thread from showing half drawn frames.
+
+    """
+    global _compositor
+    if _compositor is None:
+        _compositor = _Compositor(max_fps)
+        _compositor.start()
+
+
+def stop_compositor():
+    """Stop the refresh thread; pending requests are dropped."""
+    global _compositor
+    compositor, _compositor = _compositor, None
+    if compositor is not None:
+        compositor.stop()
+        compositor.join()
 
 
 def close_device():
     global _initialized
     if _initialized:
+        stop_compositor()
         lcdmm.close()
         os.close(_lcdfile)
         _initialized = False
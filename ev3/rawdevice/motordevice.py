@@ -1,14 +1,51 @@
 import os
+import time
 import struct
-from ctypes import sizeof
+import threading
+from array import array
+from ctypes import addressof, memmove, sizeof, string_at
 from mmap import mmap, MAP_SHARED, PROT_READ, PROT_WRITE
-from . import lms2012
+from . import lms2012, poll
 
 _initialized = False
 _pwmfile = None
 _motorfile = None
 _motormm = None
 _motordata = None
+_telemetry = None
+
+# Precompiled packers for the plain commands: opcode, ports and an optional
+# unsigned or signed byte.
+_OPCODE = struct.Struct('B')
+_PORTS = struct.Struct('2B')
+_PORTS_BYTE = struct.Struct('3B')
+_PORTS_SBYTE = struct.Struct('BBb')
+
+# One command struct per opcode, refilled by every call. Like the rest of
+# this module they are not locked: send motor commands from one thread.
+_steppower = lms2012.STEPPOWER(Cmd=lms2012.opOUTPUT_STEP_POWER)
+_timepower = lms2012.TIMEPOWER(Cmd=lms2012.opOUTPUT_TIME_POWER)
+_stepspeed = lms2012.STEPSPEED(Cmd=lms2012.opOUTPUT_STEP_SPEED)
+_timespeed = lms2012.TIMESPEED(Cmd=lms2012.opOUTPUT_TIME_SPEED)
+_stepsync = lms2012.STEPSYNC(Cmd=lms2012.opOUTPUT_STEP_SYNC)
+_timesync = lms2012.TIMESYNC(Cmd=lms2012.opOUTPUT_TIME_SYNC)
+
+# Output state last sent, per port mask (ports & 0x0f): polarity, setpoint
+# (the speed, or the power plus _POWER_SETPOINT) and whether the outputs
+# were started since. None when unknown. Commands which would not change it
+# are dropped. The last slot of each list holds the mask stored last and
+# every other mask sharing a port with it is unknown, so a command repeated
+# on one mask checks and updates a single slot. Step and time commands end
+# on their own, so they leave the setpoint and the started flag unknown.
+_polarity = [None] * 17
+_setpoint = [None] * 17
+_running = [None] * 17
+_POWER_SETPOINT = 0x200
+_hits = 0
+_misses = 0
+# Masks sharing a port with each mask, the mask itself included.
+_OVERLAPS = tuple(tuple(other for other in range(16) if other & mask or other == mask)
+                  for mask in range(16))
 
 """
 opOUTPUT_GET_TYPE     LAYER   NO       *TYPE                                   // Get output device type
@@ -49,7 +86,7 @@ def open_device():
         global _motordata
         _motordata = MOTORDATAArrray.from_buffer(_motormm)
         _initialized = True
-        os.write(_pwmfile, struct.pack('B', lms2012.opPROGRAM_START))
+        os.write(_pwmfile, _OPCODE.pack(lms2012.opPROGRAM_START))
 
 # This does not look required. Types are TACHO (for the big engines) and MINITACHO for the gun one
 # and firmware should recognize them properly.
@@ -57,22 +94,83 @@ def open_device():
 #    os.write(_pwmfile, struct.pack('5B', lms2012.opOUTPUT_SET_TYPE, *types))
 
 
+def _cached(values, ports, value):
+    global _hits, _misses
+    if values[ports & 0x0f] == value:
+        _hits += 1
+        return True
+    _misses += 1
+    return False
+
+
+def _store(values, ports, value):
+    mask = ports & 0x0f
+    if values[-1] != mask:
+        for other in _OVERLAPS[mask]:
+            values[other] = None
+        values[-1] = mask
+    values[mask] = value
+
+
+def _forget_setpoint(ports):
+    mask = ports & 0x0f
+    if _setpoint[-1] == mask and _running[-1] == mask:
+        _setpoint[mask] = _running[mask] = None
+    else:
+        _store(_setpoint, mask, None)
+        _store(_running, mask, None)
+
+
+def invalidate(ports=0x0f):
+    """Forget the output state of *ports*, so the next commands are written.
+
+    Needed only if the outputs were driven other than through this module.
+
+    """
+    _store(_polarity, ports, None)
+    _store(_setpoint, ports, None)
+    _store(_running, ports, None)
+
+
+def get_cache_stats():
+    """Get the number of commands dropped (*hits*) and written (*misses*).
+
+    Returns:
+        dict. *hits* and *misses* since the last reset_cache_stats().
+
+    """
+    return {'hits': _hits, 'misses': _misses}
+
+
+def reset_cache_stats():
+    global _hits, _misses
+    _hits = 0
+    _misses = 0
+
+
 def reset(ports):
-    os.write(_pwmfile, struct.pack('2B', lms2012.opOUTPUT_RESET, ports))
+    os.write(_pwmfile, _PORTS.pack(lms2012.opOUTPUT_RESET, ports))
+    invalidate(ports)
     clear_steps(ports)
 
 
 def start(ports):
-    os.write(_pwmfile, struct.pack('2B', lms2012.opOUTPUT_START, ports))
+    if _cached(_running, ports, True):
+        return
+    os.write(_pwmfile, _PORTS.pack(lms2012.opOUTPUT_START, ports))
+    _store(_running, ports, True)
 
 
 def stop(ports, brake=0):
-    os.write(_pwmfile, struct.pack('3B', lms2012.opOUTPUT_STOP, ports, brake))
+    os.write(_pwmfile, _PORTS_BYTE.pack(lms2012.opOUTPUT_STOP, ports, brake))
+    invalidate(ports)
 
 
 def polarity(ports, polarity=1):
-    os.write(_pwmfile,
-             struct.pack('BBb', lms2012.opOUTPUT_POLARITY, ports, polarity))
+    if polarity and _cached(_polarity, ports, polarity):
+        return
+    os.write(_pwmfile, _PORTS_SBYTE.pack(lms2012.opOUTPUT_POLARITY, ports, polarity))
+    _store(_polarity, ports, polarity or None)
 
 
 def test(ports):
@@ -89,19 +187,39 @@ def ready(ports):
 # power 1 - 127 imples polarity 0 (when 1 is min power and 127 is full power)
 # power 255 - 128 imples polarity 1 (where 128 is full power and 255 is min power).
 def power(ports, power, startmotor=True):
-    os.write(_pwmfile, struct.pack('3B', lms2012.opOUTPUT_POWER, ports, power))
+    global _hits, _misses
+    setpoint = power + _POWER_SETPOINT
+    mask = ports & 0x0f
+    if _setpoint[mask] == setpoint:
+        _hits += 1
+    else:
+        _misses += 1
+        os.write(_pwmfile, _PORTS_BYTE.pack(lms2012.opOUTPUT_POWER, ports, power))
+        if _setpoint[-1] == mask:
+            _setpoint[mask] = setpoint
+        else:
+            _store(_setpoint, mask, setpoint)
     if startmotor:
         start(ports)
 
 # see notes about power - they apply to speed as well.
 def speed(ports, speed, startmotor=True):
-    os.write(_pwmfile, struct.pack('3B', lms2012.opOUTPUT_SPEED, ports, speed))
+    global _hits, _misses
+    mask = ports & 0x0f
+    if _setpoint[mask] == speed:
+        _hits += 1
+    else:
+        _misses += 1
+        os.write(_pwmfile, _PORTS_BYTE.pack(lms2012.opOUTPUT_SPEED, ports, speed))
+        if _setpoint[-1] == mask:
+            _setpoint[mask] = speed
+        else:
+            _store(_setpoint, mask, speed)
     if startmotor:
         start(ports)
 
 def step_power(ports, power, ramp_up_steps, const_speed_steps, ramp_down_steps, brake=0, startmotor=True):
-    steppoweer = lms2012.STEPPOWER()
-    steppoweer.Cmd = lms2012.opOUTPUT_STEP_POWER
+    steppoweer = _steppower
     steppoweer.Nos = ports
     steppoweer.Power = power
     steppoweer.Step1 = ramp_up_steps
@@ -110,12 +228,12 @@ def step_power(ports, power, ramp_up_steps, const_speed_steps, ramp_down_steps,
     steppoweer.Brake = brake
     os.write(_pwmfile, steppoweer)
     if startmotor:
-        start(ports)
+        os.write(_pwmfile, _PORTS.pack(lms2012.opOUTPUT_START, ports))
+    _forget_setpoint(ports)
 
 # Time driven moves could be implemented without using this (with other functions and OS timers)
 def time_power(ports, power, ramp_up_time, const_speed_time, ramp_down_time, brake=0, startmotor=True):
-    timepower = lms2012.TIMEPOWER()
-    timepower.Cmd = lms2012.opOUTPUT_TIME_POWER
+    timepower = _timepower
     timepower.Nos = ports
     timepower.Power = power
     timepower.Time1 = ramp_up_time
@@ -124,13 +242,13 @@ def time_power(ports, power, ramp_up_time, const_speed_time, ramp_down_time, bra
     timepower.Brake = brake
     os.write(_pwmfile, timepower)
     if startmotor:
-        start(ports)
+        os.write(_pwmfile, _PORTS.pack(lms2012.opOUTPUT_START, ports))
+    _forget_setpoint(ports)
 
 
 # This is similar to step_power() because P = FV (Power is directly propotional to speed)
 def step_speed(ports, speed, ramp_up_steps, const_speed_steps, ramp_down_steps, brake=0, startmotor=True):
-    stepspeed = lms2012.STEPSPEED()
-    stepspeed.Cmd = lms2012.opOUTPUT_STEP_SPEED
+    stepspeed = _stepspeed
     stepspeed.Nos = ports
     stepspeed.Speed = speed
     stepspeed.Step1 = ramp_up_steps
@@ -139,12 +257,12 @@ def step_speed(ports, speed, ramp_up_steps, const_speed_steps, ramp_down_steps,
     stepspeed.Brake = brake
     os.write(_pwmfile, stepspeed)
     if startmotor:
-        start(ports)
+        os.write(_pwmfile, _PORTS.pack(lms2012.opOUTPUT_START, ports))
+    _forget_setpoint(ports)
 
 # This is similar to step_speed() because P = FV (Power is directly propotional to speed)
 def time_speed(ports, speed, ramp_up_time, const_speed_time, ramp_down_time, brake=0, startmotor=True):
-    timespeed = lms2012.TIMESPEED()
-    timespeed.Cmd = lms2012.opOUTPUT_TIME_SPEED
+    timespeed = _timespeed
     timespeed.Nos = ports
     timespeed.Speed = speed
     timespeed.Time1 = ramp_up_time
@@ -153,13 +271,13 @@ def time_speed(ports, speed, ramp_up_time, const_speed_time, ramp_down_time, bra
     timespeed.Brake = brake
     os.write(_pwmfile, timespeed)
     if startmotor:
-        start(ports)
+        os.write(_pwmfile, _PORTS.pack(lms2012.opOUTPUT_START, ports))
+    _forget_setpoint(ports)
 
 
 # For unknown reasons this seems to freeze the whole control unit.
 def step_sync(ports, speed, turn=0, step=0, brake=0, startmotor=True):
-    stepsync = lms2012.STEPSYNC()
-    stepsync.Cmd = lms2012.opOUTPUT_STEP_SYNC
+    stepsync = _stepsync
     stepsync.Nos = ports
     stepsync.Speed = speed
     stepsync.Turn = turn
@@ -167,12 +285,12 @@ def step_sync(ports, speed, turn=0, step=0, brake=0, startmotor=True):
     stepsync.Brake = brake
     os.write(_pwmfile, stepsync)
     if startmotor:
-        start(ports)
+        os.write(_pwmfile, _PORTS.pack(lms2012.opOUTPUT_START, ports))
+    _forget_setpoint(ports)
 
 
 def time_sync(ports, speed, turn=0, time=0, brake=0, startmotor=True):
-    timesync = lms2012.TIMESYNC()
-    timesync.Cmd = lms2012.opOUTPUT_TIME_SYNC
+    timesync = _timesync
     timesync.Nos = ports
     timesync.Speed = speed
     timesync.Turn = turn
@@ -180,7 +298,8 @@ def time_sync(ports, speed, turn=0, time=0, brake=0, startmotor=True):
     timesync.Brake = brake
     os.write(_pwmfile, timesync)
     if startmotor:
-        start(ports)
+        os.write(_pwmfile, _PORTS.pack(lms2012.opOUTPUT_START, ports))
+    _forget_setpoint(ports)
 
 def clear_tacho_sensor(ports):
     port = 0
@@ -190,7 +309,7 @@ def clear_tacho_sensor(ports):
         port += 1
 
 def clear_steps(ports):
-    os.write(_pwmfile, struct.pack('2B', lms2012.opOUTPUT_CLR_COUNT, ports))
+    os.write(_pwmfile, _PORTS.pack(lms2012.opOUTPUT_CLR_COUNT, ports))
     clear_tacho_sensor(ports)
 
 
@@ -206,11 +325,159 @@ def get_sensor(port):
     return _motordata[port].TachoSensor
 
 
+def get_motordata():
+    return _motordata
+
+
+class Telemetry(threading.Thread):
+    """Samples the MOTORDATA of all four ports *rate* times per second.
+
+    The last *length* samples are kept in a preallocated ring, each with
+    its poll.monotonic() time. Started by start_telemetry().
+
+    """
+
+    _SAMPLE = lms2012.MOTORDATA * 4
+    # Offsets of the fields in 32 bit words (bytes for Speed), used to
+    # pull a port's values out of a copy of the ring with array slicing.
+    _COUNTS = lms2012.MOTORDATA.TachoCounts.offset // 4
+    _SENSOR = lms2012.MOTORDATA.TachoSensor.offset // 4
+    _SPEED = lms2012.MOTORDATA.Speed.offset
+
+    def __init__(self, rate, length):
+        threading.Thread.__init__(self, name='motor-telemetry')
+        self.daemon = True
+        self.rate = rate
+        self.length = length
+        # Samples skipped because the thread fell behind.
+        self.overruns = 0
+        self._interval = 1.0 / rate
+        self._size = sizeof(self._SAMPLE)
+        self._ring = (self._SAMPLE * length)()
+        self._times = array('d', [0.0]) * length
+        self._count = 0
+        self._lock = threading.Lock()
+        self._running = True
+
+    def __len__(self):
+        return min(self._count, self.length)
+
+    def stop(self):
+        self._running = False
+
+    def sample(self):
+        """Take one sample now."""
+        slot = self._count % self.length
+        with self._lock:
+            memmove(addressof(self._ring) + slot * self._size, addressof(_motordata), self._size)
+            self._times[slot] = poll.monotonic()
+            self._count += 1
+
+    def run(self):
+        due = poll.monotonic()
+        while self._running:
+            self.sample()
+            due += self._interval
+            delay = due - poll.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                missed = int(-delay / self._interval)
+                self.overruns += missed
+                due += missed * self._interval
+
+    def _first_since(self, first, end, since):
+        # Oldest sample index in first..end taken at or after *since*.
+        while first < end:
+            middle = (first + end) // 2
+            if self._times[middle % self.length] < since:
+                first = middle + 1
+            else:
+                end = middle
+        return first
+
+    def window(self, port, seconds=None):
+        """Get the samples of *port*, oldest first.
+
+        Args:
+            seconds (float): only the samples taken in this many seconds
+                before the newest one; all kept samples by default.
+
+        Returns:
+            tuple. (times, tacho_counts, tacho_sensor, speeds) as arrays
+            of the same length.
+
+        """
+        with self._lock:
+            end = self._count
+            first = end - min(end, self.length)
+            if seconds is not None and end:
+                since = self._times[(end - 1) % self.length] - seconds
+                first = self._first_since(first, end, since)
+            start = first % self.length
+            count = end - first
+            head = min(count, self.length - start)
+            times = self._times[start:start + head] + self._times[:count - head]
+            raw = string_at(addressof(self._ring) + start * self._size, head * self._size) + \
+                string_at(addressof(self._ring), (count - head) * self._size)
+        words = array('i', raw)
+        stride = self._size // 4
+        offset = port * sizeof(lms2012.MOTORDATA)
+        return (times,
+                words[offset // 4 + self._COUNTS::stride],
+                words[offset // 4 + self._SENSOR::stride],
+                array('b', raw)[offset + self._SPEED::self._size])
+
+    def latest(self, port):
+        """Get the newest sample of *port* as (time, tacho_counts, tacho_sensor, speed)."""
+        with self._lock:
+            if not self._count:
+                return None
+            slot = (self._count - 1) % self.length
+            data = self._ring[slot][port]
+            return self._times[slot], data.TachoCounts, data.TachoSensor, data.Speed
+
+
+def start_telemetry(rate=1000, length=1024):
+    """Sample the motor data from a background thread.
+
+    Speed estimation, stall detection and logging can then share the
+    history instead of each reading the mmap'ed fields.
+
+    Args:
+        rate (float): samples per second.
+        length (int): number of samples kept.
+
+    Returns:
+        Telemetry. The running sampler; it is kept if already started.
+
+    """
+    global _telemetry
+    if _telemetry is None:
+        _telemetry = Telemetry(rate, length)
+        _telemetry.start()
+    return _telemetry
+
+
+def get_telemetry():
+    return _telemetry
+
+
+def stop_telemetry():
+    global _telemetry
+    telemetry, _telemetry = _telemetry, None
+    if telemetry is not None:
+        telemetry.stop()
+        telemetry.join()
+
+
 def close_device():
     global _initialized
     if _initialized:
-        os.write(_pwmfile, struct.pack('B', lms2012.opPROGRAM_STOP))
+        stop_telemetry()
+        os.write(_pwmfile, _OPCODE.pack(lms2012.opPROGRAM_STOP))
         _motormm.close()
         os.close(_motorfile)
         os.close(_pwmfile)
+        invalidate()
         _initialized = False
@@ -0,0 +1,110 @@
+"""Waiting on driver state with a monotonic clock.
+
+Driver status changes usually land well within a millisecond, so until()
+polls quickly at first and only backs off exponentially towards the
+coarse step the caller would otherwise have slept for. Deadlines use a
+monotonic clock and are not affected by wall clock adjustments (the brick
+sets its clock over the network after boot).
+
+"""
+import os
+import time
+import ctypes
+import ctypes.util
+
+_CLOCK_MONOTONIC = 1
+
+MIN_DELAY = 0.0002  # seconds
+MAX_DELAY = 0.025
+
+_stats = {}
+
+
+class _timespec(ctypes.Structure):
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+
+def _load_clock_gettime():
+    for name in ('rt', 'c'):
+        path = ctypes.util.find_library(name)
+        if path is None:
+            continue
+        try:
+            return ctypes.CDLL(path, use_errno=True).clock_gettime
+        except (OSError, AttributeError):
+            pass
+    return None
+
+
+if hasattr(time, 'monotonic'):
+    monotonic = time.monotonic
+else:
+    _clock_gettime = _load_clock_gettime()
+    if _clock_gettime is None:
+        monotonic = time.time
+    else:
+        _clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(_timespec)]
+
+        def monotonic():
+            # A timespec per call: ctypes releases the GIL during the call
+            # and several threads read the clock.
+            ts = _timespec()
+            if _clock_gettime(_CLOCK_MONOTONIC, ctypes.byref(ts)) != 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno))
+            return ts.tv_sec + ts.tv_nsec * 1e-9
+
+
+def until(attempt, timeout, name, max_delay=MAX_DELAY):
+    """Call *attempt* until it returns something other than None.
+
+    Args:
+        attempt (callable): performs one try, returns None if not done yet.
+        timeout (float): seconds to keep trying.
+        name (str): key under which the time spent waiting is recorded.
+        max_delay (float): upper bound of the sleep between tries.
+
+    Returns:
+        The first result other than None, or None on timeout.
+
+    """
+    start = monotonic()
+    deadline = start + timeout
+    delay = MIN_DELAY
+    while True:
+        result = attempt()
+        now = monotonic()
+        if result is not None or now > deadline:
+            break
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+    _record(name, now - start, result is None)
+    return result
+
+
+def _record(name, waited, timed_out):
+    entry = _stats.get(name)
+    if entry is None:
+        entry = _stats[name] = {'calls': 0, 'timeouts': 0, 'total': 0.0,
+                                'max': 0.0, 'last': 0.0}
+    entry['calls'] += 1
+    entry['timeouts'] += timed_out
+    entry['total'] += waited
+    entry['last'] = waited
+    if waited > entry['max']:
+        entry['max'] = waited
+
+
+def get_stats():
+    """Get wait times recorded by until().
+
+    Returns:
+        dict. name -> dict with *calls*, *timeouts* and *total*, *max*,
+        *last* wait time in seconds.
+
+    """
+    return dict((name, dict(entry)) for name, entry in _stats.items())
+
+
+def reset_stats():
+    _stats.clear()
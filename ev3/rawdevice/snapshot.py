@@ -0,0 +1,185 @@
+"""Consistent copies of the shared device memory.
+
+Getters in the device modules read the driver mmaps field by field, so two
+values read one after the other may come from different driver updates.
+A snapshot copies the regions the getters use out of every open device in
+one go and serves all values of a control tick from that copy.
+
+Simple usage:
+    >>> from ev3.rawdevice import snapshot
+    >>> state = snapshot.Snapshot()
+    >>> while True:
+    ...     snapshot.capture(state)
+    ...     if state.is_pressed(0) and state.get_speed(1) == 0: break
+
+"""
+from ctypes import addressof, c_byte, c_char, memmove, sizeof
+from . import analogdevice, iicdevice, lms2012, motordevice, poll, uartdevice, ui
+
+INPUT_DEVICE_NUMBER = 4
+OUTPUT_DEVICE_NUMBER = 4
+
+# Byte ranges copied with a single memmove each, packed one after the other
+# into a small buffer. The analog history and the UART/IIC rings are
+# skipped; only their current slot is copied, see _copy_current().
+_ANALOG_REGIONS = ((0, lms2012.ANALOG.Pin1.offset),
+                   (lms2012.ANALOG.Actual.offset, sizeof(lms2012.ANALOG)))
+_UART_REGIONS = ((lms2012.UART.Actual.offset, sizeof(lms2012.UART)),)
+_IIC_REGIONS = ((lms2012.IIC.Actual.offset, sizeof(lms2012.IIC)),)
+_UI_REGIONS = ((0, sizeof(lms2012.UI)),)
+_MOTORDATA_REGIONS = ((0, sizeof(lms2012.MOTORDATA) * OUTPUT_DEVICE_NUMBER),)
+
+_Slots = c_byte * lms2012.MAX_DEVICE_DATALENGTH * INPUT_DEVICE_NUMBER
+
+
+def _packed(regions):
+    # (start, end, offset in the buffer) per region, and the buffer size.
+    layout = []
+    size = 0
+    for start, end in regions:
+        layout.append((start, end, size))
+        size += end - start
+    return tuple(layout), size
+
+
+def _buffer(layout):
+    return (c_char * layout[1])()
+
+
+def _field(buf, layout, struct, name):
+    # Typed view of *struct*.*name* inside a buffer filled by _copy().
+    offset = getattr(struct, name).offset
+    for start, end, packed in layout[0]:
+        if start <= offset < end:
+            return dict(struct._fields_)[name].from_buffer(buf, packed + offset - start)
+    raise ValueError('%s.%s is not copied' % (struct.__name__, name))
+
+
+def _copy(dst, src, layout):
+    dst_address = addressof(dst)
+    src_address = addressof(src)
+    for start, end, packed in layout[0]:
+        memmove(dst_address + packed, src_address + start, end - start)
+
+
+def _copy_current(slots, src, raw, actual):
+    # *actual* holds the cursors copied already; the slot they point at is
+    # not rewritten until the driver went round the whole ring.
+    size = lms2012.MAX_DEVICE_DATALENGTH
+    dst_address = addressof(slots)
+    src_address = addressof(src) + raw.offset
+    for port in range(INPUT_DEVICE_NUMBER):
+        memmove(dst_address + port * size,
+                src_address + (port * lms2012.DEVICE_LOGBUF_SIZE + actual[port]) * size, size)
+
+
+_ANALOG = _packed(_ANALOG_REGIONS)
+_UART = _packed(_UART_REGIONS)
+_IIC = _packed(_IIC_REGIONS)
+_UI = _packed(_UI_REGIONS)
+_MOTORDATA = _packed(_MOTORDATA_REGIONS)
+
+
+class Snapshot(object):
+    """Read-only view of the device state taken by capture().
+
+    Getters mirror the ones of the device modules. *timestamp* is the
+    poll.monotonic() time at which all devices were copied, None before the first
+    capture. Only the copied regions and the current UART/IIC slot of each
+    port are kept, about a kilobyte in all.
+
+    """
+
+    __slots__ = ('timestamp', '_analog', '_in_pin1', '_in_pin6', '_in_conn',
+                 '_battery_current', '_cell123456', '_motor_current',
+                 '_uart', '_uart_actual', '_uart_status', '_uart_raw',
+                 '_iic', '_iic_actual', '_iic_status', '_iic_raw',
+                 '_ui', '_motordata')
+
+    def __init__(self):
+        self.timestamp = None
+        analog = self._analog = _buffer(_ANALOG)
+        self._in_pin1 = _field(analog, _ANALOG, lms2012.ANALOG, 'InPin1')
+        self._in_pin6 = _field(analog, _ANALOG, lms2012.ANALOG, 'InPin6')
+        self._in_conn = _field(analog, _ANALOG, lms2012.ANALOG, 'InConn')
+        self._battery_current = _field(analog, _ANALOG, lms2012.ANALOG, 'BatteryCurrent')
+        self._cell123456 = _field(analog, _ANALOG, lms2012.ANALOG, 'Cell123456')
+        self._motor_current = _field(analog, _ANALOG, lms2012.ANALOG, 'MotorCurrent')
+        uart = self._uart = _buffer(_UART)
+        self._uart_actual = _field(uart, _UART, lms2012.UART, 'Actual')
+        self._uart_status = _field(uart, _UART, lms2012.UART, 'Status')
+        self._uart_raw = _Slots()
+        iic = self._iic = _buffer(_IIC)
+        self._iic_actual = _field(iic, _IIC, lms2012.IIC, 'Actual')
+        self._iic_status = _field(iic, _IIC, lms2012.IIC, 'Status')
+        self._iic_raw = _Slots()
+        self._ui = lms2012.UI()
+        self._motordata = (lms2012.MOTORDATA * OUTPUT_DEVICE_NUMBER)()
+
+    def get_pin1(self, port):
+        return self._in_pin1[port]
+
+    def get_pin6(self, port):
+        return self._in_pin6[port]
+
+    def get_connection_type(self, port):
+        return self._in_conn[port]
+
+    def get_battery_raw(self):
+        return self._battery_current.value, self._cell123456.value, self._motor_current.value
+
+    def get_uart_status(self, port):
+        return self._uart_status[port]
+
+    def get_uart_value_bytes(self, port):
+        return self._uart_raw[port]
+
+    def get_iic_status(self, port):
+        return self._iic_status[port]
+
+    def get_iic_value_bytes(self, port):
+        return self._iic_raw[port]
+
+    def is_pressed(self, key):
+        return self._ui.Pressed[key]
+
+    def get_speed(self, port):
+        return self._motordata[port].Speed
+
+    def get_tacho(self, port):
+        return self._motordata[port].TachoCounts
+
+    def get_sensor(self, port):
+        return self._motordata[port].TachoSensor
+
+
+def capture(into=None):
+    """Copy the state of all open devices.
+
+    Args:
+        into (Snapshot): snapshot to refill; a new one is allocated if None.
+        Reusing one snapshot per control loop keeps capture() allocation free.
+
+    Returns:
+        Snapshot.
+
+    """
+    if into is None:
+        into = Snapshot()
+    timestamp = poll.monotonic()
+    if analogdevice._initialized:
+        _copy(into._analog, analogdevice.get_analog(), _ANALOG)
+    if uartdevice._initialized:
+        uart = uartdevice.get_uart()
+        _copy(into._uart, uart, _UART)
+        _copy_current(into._uart_raw, uart, lms2012.UART.Raw, into._uart_actual)
+    if iicdevice._initialized:
+        iic = iicdevice.get_iic()
+        _copy(into._iic, iic, _IIC)
+        _copy_current(into._iic_raw, iic, lms2012.IIC.Raw, into._iic_actual)
+    if ui._initialized:
+        _copy(into._ui, ui.get_ui(), _UI)
+    if motordevice._initialized:
+        _copy(into._motordata, motordevice.get_motordata(), _MOTORDATA)
+    into.timestamp = timestamp
+    return into
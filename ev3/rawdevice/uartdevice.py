@@ -1,10 +1,8 @@
 import os
-import time
-import datetime
 from fcntl import ioctl
-from ctypes import sizeof
+from ctypes import addressof, c_char, memmove, sizeof, string_at
 from mmap import mmap, MAP_SHARED, PROT_READ, PROT_WRITE
-from . import lms2012, lms2012extra
+from . import get_devcon, lms2012, lms2012extra, poll
 from ev3.error import SensorError
 
 INPUT_DEVICE_NUMBER = 4
@@ -16,12 +14,16 @@ _uarmm = None
 _uart = None
 _devcon = None
 
+DEVICE_LOGBUF_SIZE = lms2012.DEVICE_LOGBUF_SIZE
+UART_DATA_LENGTH = lms2012.UART_DATA_LENGTH
+_PORT_RAW_SIZE = DEVICE_LOGBUF_SIZE * UART_DATA_LENGTH
+
 
 def open_device():
     global _initialized
     if not _initialized:
         global _devcon
-        from . import devcon as _devcon
+        _devcon = get_devcon()
         global _uartfile
         _uartfile = os.open(lms2012.UART_DEVICE_NAME, os.O_RDWR)
         global uartmm
@@ -32,50 +34,82 @@ def open_device():
         _initialized = True
 
 
+def wait_no_zero_statuses(ports):
+    statuses = {}
+
+    def attempt():
+        for port in ports:
+            if port not in statuses:
+                status = _uart.Status[port]
+                if status != 0:
+                    statuses[port] = status
+        if len(statuses) == len(ports):
+            return statuses
+
+    if poll.until(attempt, 10, 'uart status', 0.025) is None:
+        raise SensorError("wait zero status timeout at ports %s" %
+                          sorted(set(ports) - set(statuses)))
+    return statuses
+
+
 def wait_no_zero_status(port):
-    timeout = datetime.datetime.now() + datetime.timedelta(seconds=10)
-    while True:
-        status = _uart.Status[port]
-        if status != 0:
-            break
-        if datetime.datetime.now() > timeout:
-            raise SensorError("wait zero status timeout at port %d", port)
-        time.sleep(0.025)
-    return status
+    return wait_no_zero_statuses([port])[port]
 
 
-def clear_change(port):
-    timeout = datetime.datetime.now() + datetime.timedelta(seconds=1)
-    while True:
-        status = _uart.Status[port]
-        if (status & lms2012.UART_DATA_READY) != 0 and (status & lms2012.UART_PORT_CHANGED) == 0:
-            break
-        if datetime.datetime.now() > timeout:
-            break
-        _devcon.Connection[port] = lms2012.CONN_INPUT_UART
-        _devcon.Type[port] = 0
-        _devcon.Mode[port] = 0
+def _is_changed(status):
+    return (status & lms2012.UART_DATA_READY) == 0 or (status & lms2012.UART_PORT_CHANGED) != 0
+
+
+def clear_changes(ports):
+    pending = list(ports)
+
+    def attempt():
+        pending[:] = [port for port in pending if _is_changed(_uart.Status[port])]
+        if not pending:
+            return True
+        for port in pending:
+            _devcon.Connection[port] = lms2012.CONN_INPUT_UART
+            _devcon.Type[port] = 0
+            _devcon.Mode[port] = 0
         ioctl(_uartfile, lms2012extra.UART_CLEAR_CHANGED, _devcon)
-        _uart.Status[port] = _uart.Status[port] & ~ lms2012.UART_PORT_CHANGED
-        time.sleep(0.01)
+        for port in pending:
+            _uart.Status[port] = _uart.Status[port] & ~ lms2012.UART_PORT_CHANGED
 
+    poll.until(attempt, 1, 'uart clear change', 0.01)
 
-def set_mode(port, mode):
-    timeout = datetime.datetime.now() + datetime.timedelta(seconds=5)
-    while (True):
-        _devcon.Connection[port] = lms2012.CONN_INPUT_UART
-        _devcon.Type[port] = 0
-        _devcon.Mode[port] = mode
+
+def clear_change(port):
+    clear_changes([port])
+
+
+# Configures all ports in *modes* ({port: mode}) with a single ioctl and
+# waits for them together, so the call takes as long as the slowest port.
+def set_modes(modes):
+    pending = dict(modes)
+
+    def attempt():
+        for port, mode in pending.items():
+            _devcon.Connection[port] = lms2012.CONN_INPUT_UART
+            _devcon.Type[port] = 0
+            _devcon.Mode[port] = mode
         ioctl(_uartfile, lms2012extra.UART_SET_CONN, _devcon)
-        status = wait_no_zero_status(port)
-        # print "uart status %d" % status
-        if status & lms2012.UART_PORT_CHANGED:
-            clear_change(port)
-        else:
-            break
-        if datetime.datetime.now() > timeout:
-            break
-        time.sleep(0.01)
+        statuses = wait_no_zero_statuses(list(pending))
+        for port, status in statuses.items():
+            if not status & lms2012.UART_PORT_CHANGED:
+                del pending[port]
+        if not pending:
+            return True
+        clear_changes(list(pending))
+
+    poll.until(attempt, 5, 'uart set mode', 0.01)
+
+
+def set_mode(port, mode):
+    set_modes({port: mode})
+
+
+def get_uart():
+    return _uart
 
 
 def get_value_bytes(port):
@@ -87,6 +121,82 @@ def get_value_byte(port):
     return get_value_bytes(port)[0]
 
 
+class SampleReader(object):
+    """Reads every sample the driver logged on a port since the previous read.
+
+    Samples are copied straight out of the shared Raw ring into a buffer
+    allocated once, UART_DATA_LENGTH bytes (signed DATA8 values) per sample.
+
+    The ring carries no sequence numbers, so an overrun is detected by
+    checking that the last consumed slot still holds the sample read from
+    it. When *period* is given, a read coming too soon for the sensor to
+    have sent a whole ring is never taken for an overrun. After an overrun
+    the reader resynchronizes to the oldest sample still in the ring and
+    the dropped count is a lower bound.
+
+    Args:
+        port (int): sensor port.
+        period (float): shortest time in seconds between two samples of
+            the sensor in its current mode, if known.
+
+    """
+
+    def __init__(self, port, period=None):
+        self.port = port
+        self.period = period
+        self.buffer = bytearray(_PORT_RAW_SIZE)
+        self.dropped = 0
+        self._view = memoryview(self.buffer)
+        self._address = addressof(c_char.from_buffer(self.buffer))
+        self.sync()
+
+    def _ring(self):
+        return addressof(_uart) + lms2012.UART.Raw.offset + self.port * _PORT_RAW_SIZE
+
+    def sync(self):
+        """Skip all samples logged so far."""
+        self._index = _uart.Actual[self.port]
+        self._last = string_at(self._ring() + self._index * UART_DATA_LENGTH,
+                               UART_DATA_LENGTH)
+        self._time = poll.monotonic()
+
+    def read(self):
+        """Copy out the samples logged since the previous call.
+
+        Returns:
+            tuple. (memoryview, int) -- the new samples, oldest first, and
+            the number of samples lost to an overrun.
+
+        """
+        ring = self._ring()
+        now = poll.monotonic()
+        actual = _uart.Actual[self.port]
+        count = (actual - self._index) % DEVICE_LOGBUF_SIZE
+        # Most samples the sensor could have sent since the previous read;
+        # fewer than a ring means it cannot have lapped us.
+        wrap_possible = not self.period or \
+            (now - self._time) / self.period >= DEVICE_LOGBUF_SIZE
+        dropped = 0
+        if wrap_possible and \
+                string_at(ring + self._index * UART_DATA_LENGTH, UART_DATA_LENGTH) != self._last:
+            # The writer lapped us; the slot after Actual is the next one
+            # to be overwritten, so it is left out.
+            dropped = count + 1
+            count = DEVICE_LOGBUF_SIZE - 1
+        start = (actual - count + 1) % DEVICE_LOGBUF_SIZE
+        first = min(count, DEVICE_LOGBUF_SIZE - start)
+        memmove(self._address, ring + start * UART_DATA_LENGTH,
+                first * UART_DATA_LENGTH)
+        if count > first:
+            memmove(self._address + first * UART_DATA_LENGTH, ring,
+                    (count - first) * UART_DATA_LENGTH)
+        self._index = actual
+        self._last = string_at(ring + actual * UART_DATA_LENGTH, UART_DATA_LENGTH)
+        self._time = now
+        self.dropped += dropped
+        return self._view[:count * UART_DATA_LENGTH], dropped
+
+
 def reset(port):
     _devcon.Connection[port] = lms2012.CONN_NONE
     _devcon.Type[port] = 0
@@ -31,6 +31,10 @@ def is_pressed(key):
     return _ui.Pressed[key]
 
 
+def get_ui():
+    return _ui
+
+
 def close_device():
     global _initialized
     if _initialized:
@@ -3,26 +3,26 @@ import sensor
 from ..rawdevice import lms2012
 
 
-class HiTechncCompass(sensor.IICSensor):
+class HiTechncCompass(sensor.RegisterMapSensor):
+
+    registers = {'angle': sensor.Register(0x44, 'H')}
 
     def __init__(self, port, address):
         super(HiTechncCompass, self).__init__(port, address)
 
     def get_angle(self):
-        sensor_data = self.read(0x44, 2)
-        angle = (0x00FF & sensor_data[0])
-        angle += ((0x00FF & sensor_data[1]) << 8)
-        return (angle)
+        return self.read_register('angle')
+
 
+class HiTechncPIRSensor(sensor.RegisterMapSensor):
 
-class HiTechncPIRSensor(sensor.IICSensor):
+    registers = {'measurement': sensor.Register(0x42, 'b')}
 
     def __init__(self, port, address):
         super(HiTechncPIRSensor, self).__init__(port, address)
 
     def get_measurement(self):
-        sensor_data = self.read(0x42, 1)
-        return sensor_data[0]
+        return self.read_register('measurement')
 
     def set_deadband(self, db):
         self.command(0x41, db)
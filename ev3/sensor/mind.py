@@ -1,61 +1,96 @@
 import sensor
 import functools
 
+_psp_registers = {"button_set_1": 0x42,
+                  "button_set_2": 0x43,
+                  "x_left": 0x44,
+                  "y_left": 0x45,
+                  "x_right": 0x46,
+                  "y_right": 0x47,
+                  "up": 0x4A,
+                  "right": 0x4B,
+                  "down": 0x4C,
+                  "left": 0x4D,
+                  "l2": 0x4E,
+                  "r2": 0x4F,
+                  "l1": 0x50,
+                  "r1": 0x51,
+                  "triangle": 0x52,
+                  "circle": 0x52,
+                  "cross": 0x53,
+                  "square": 0x54,
 
-class PSPNxV4(sensor.IICSensor):
-
-    __command_map = {"button_set_1": 0x42,
-                     "button_set_2": 0x43,
-                     "x_left": 0x44,
-                     "y_left": 0x45,
-                     "x_right": 0x46,
-                     "y_right": 0x47,
-                     "up": 0x4A,
-                     "right": 0x4B,
-                     "down": 0x4C,
-                     "left": 0x4D,
-                     "l2": 0x4E,
-                     "r2": 0x4F,
-                     "l1": 0x50,
-                     "r1": 0x51,
-                     "triangle": 0x52,
-                     "circle": 0x52,
-                     "cross": 0x53,
-                     "square": 0x54,
-
-                     }
+                  }
+_psp_names = tuple(name for register, name in
+                   sorted((register, name) for name, register in _psp_registers.items()))
+
+
+class PSPNxV4State(object):
+    """Buttons and sticks of PSPNxV4, as filled in by PSPNxV4.read_state()."""
+
+    __slots__ = _psp_names
+
+
+class PSPNxV4(sensor.RegisterMapSensor):
+
+    __command_map = _psp_registers
+    registers = dict((name, sensor.Register(register))
+                     for name, register in _psp_registers.items())
 
     def __init__(self, port, address=0x02):
         self.port = port
         super(PSPNxV4, self).__init__(port, address)
+        self._state = PSPNxV4State()
         # Initialize the Playstation 2 Wireless Receiver dongle (attached to
         # PSPNxV4-Nx)
         self.command(0x41, 0x49)
 
     def read_value(self, button):
-        register = PSPNxV4.__command_map[button]
-        return self.read_single_byte(register) & 0xff
+        return self.read_register(button)
+
+    def read_state(self, state=None):
+        """Read all buttons and sticks in a single transaction.
+
+        Args:
+            state (PSPNxV4State): object to fill, by default one owned by
+            the sensor and refilled on every call.
+
+        Returns:
+            PSPNxV4State.
+
+        """
+        if state is None:
+            state = self._state
+        for name, value in zip(_psp_names, self.read_registers(*_psp_names)):
+            setattr(state, name, value)
+        return state
 
     def __getattr__(self, attrName):
-        return functools.partial(self.read_value, attrName[len("get_"):])
+        button = attrName[len("get_"):]
+        if not attrName.startswith("get_") or button not in PSPNxV4.__command_map:
+            raise AttributeError(attrName)
+        # Cache the getter so later lookups do not come back here.
+        getter = functools.partial(self.read_value, button)
+        setattr(self, attrName, getter)
+        return getter
+
 
+class DistNxV3(sensor.RegisterMapSensor):
 
-class DistNxV3(sensor.IICSensor):
+    registers = {'distance': sensor.Register(0x42, 'H'),
+                 'voltage': sensor.Register(0x44, 'H')}
 
     def __init__(self, port, address=0x02):
         super(DistNxV3, self).__init__(port, address)
 
     def get_distance(self):
-        data = self.read(0x42, 2)
-        distance = (0x00FF & data[0])
-        distance += ((0x00FF & data[1]) << 8)
-        return distance
+        return self.read_register('distance')
 
     def get_voltage(self):
-        data = self.read(0x44, 2)
-        voltage = (0x00FF & data[0])
-        voltage += ((0x00FF & data[1]) << 8)
-        return voltage
+        return self.read_register('voltage')
+
+    def get_distance_and_voltage(self):
+        return self.read_registers('distance', 'voltage')
 
     def energize(self):
         self.command(0x41, 0x45)
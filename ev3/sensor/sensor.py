@@ -1,7 +1,10 @@
 import time
+import struct
+from ..error import SensorError
 from ..rawdevice import uartdevice
 from ..rawdevice import analogdevice
 from ..rawdevice import iicdevice
+from ..rawdevice import iicexecutor
 
 
 class UartSensor(object):
@@ -21,6 +24,9 @@ class UartSensor(object):
     def get_value_bytes(self):
         return uartdevice.get_value_bytes(self.port)
 
+    def get_sample_reader(self, period=None):
+        return uartdevice.SampleReader(self.port, period)
+
     def reset(self):
         uartdevice.reset(self.port)
 
@@ -37,10 +43,14 @@ class AnalogSensor(object):
     def get_pin6_value(self):
         return analogdevice.get_pin6(self.port)
 
+    def get_log_reader(self, pin=6, period=None):
+        return analogdevice.LogReader(self.port, pin, period)
+
 
 class IICSensor(object):
 
     def __init__(self, port, address):
+        self._prepared = {}
         self.port = port
         iicdevice.reset(port)
         self.address = address
@@ -50,7 +60,35 @@ class IICSensor(object):
             self.port, self.address, send_buf, read_length)
         return values[:read_length]
 
+    def prepare(self, send_buf, read_length):
+        key = (tuple(send_buf), read_length)
+        transaction = self._prepared.get(key)
+        if transaction is None:
+            transaction = iicdevice.Transaction(
+                self.port, self.address, send_buf, read_length)
+            self._prepared[key] = transaction
+        return transaction
+
+    def start_polling(self, register, read_length, period=10):
+        """Let the driver read *register* every *period* ms.
+
+        read() of the same register and length, and the prepared
+        transaction for it, are then served from the IIC mmap without a
+        syscall. Any other transaction on the port stops the polling.
+
+        Returns:
+            bool. True once the first value arrived.
+
+        """
+        return self.prepare([register], read_length).start_polling(period)
+
+    def stop_polling(self, register, read_length):
+        self.prepare([register], read_length).stop_polling()
+
     def read(self, register, read_length=32):
+        transaction = self._prepared.get(((register,), read_length))
+        if transaction is not None and transaction.polling:
+            return iicdevice.get_value_bytes(self.port)[:read_length]
         values = iicdevice.i2c_transaction(
             self.port, self.address, [register], read_length)
         return values[:read_length]
@@ -63,14 +101,102 @@ class IICSensor(object):
     def command(self, register, cmd):
         iicdevice.i2c_transaction(self.port, self.address, [register, cmd], 0)
 
+    def read_async(self, register, read_length=32):
+        """Like read(), run on the I2C worker of the port.
+
+        Returns:
+            iicexecutor.Future.
+
+        """
+        transaction = self._prepared.get(((register,), read_length))
+        if transaction is not None and transaction.polling:
+            future = iicexecutor.Future()
+            future.set_result(self.read(register, read_length))
+            return future
+        return iicexecutor.read(self.port, self.address, [register], read_length)
+
+    def command_async(self, register, cmd):
+        return iicexecutor.submit(self.port, iicdevice.i2c_transaction,
+                                  self.port, self.address, [register, cmd], 0)
+
     def version(self):
-        return bytearray(self.read(0x00, 8)).decode()
+        return bytearray(iicdevice.read_identity(self.port, self.address, 0x00)).decode()
 
     def vendor(self):
-        return bytearray(self.read(0x08, 8)).decode()
+        return bytearray(iicdevice.read_identity(self.port, self.address, 0x08)).decode()
 
     def device(self):
-        return bytearray(self.read(0x10, 8)).decode()
+        return bytearray(iicdevice.read_identity(self.port, self.address, 0x10)).decode()
 
 
-__all__ = ['IICSensor', 'UartSensor', 'AnalogSensor']
+class Register(object):
+    """Register of an I2C sensor, decoded little-endian with *fmt*.
+
+    Args:
+        address (int): first register.
+        fmt (str): struct format of the value, e.g. 'B', 'b', 'H'.
+
+    """
+
+    def __init__(self, address, fmt='B'):
+        self.address = address
+        self.struct = struct.Struct('<' + fmt)
+        self.size = self.struct.size
+
+
+class RegisterMapSensor(IICSensor):
+    """I2C sensor described by a map of named registers.
+
+    Subclasses set *registers* to a dict of name -> Register. Registers
+    read together whose addresses are at most MAX_GAP bytes apart are
+    merged into one transaction of up to MAX_READ_LENGTH bytes.
+
+    """
+
+    MAX_GAP = 4
+    MAX_READ_LENGTH = iicdevice.lms2012.IIC_DATA_LENGTH
+
+    registers = {}
+
+    def __init__(self, port, address):
+        self._plans = {}
+        super(RegisterMapSensor, self).__init__(port, address)
+
+    def _plan(self, names):
+        spans = []
+        for address, index, name in sorted((self.registers[name].address, index, name)
+                                           for index, name in enumerate(names)):
+            register = self.registers[name]
+            if not spans or address - spans[-1][1] > self.MAX_GAP or \
+                    max(spans[-1][1], address + register.size) - spans[-1][0] > self.MAX_READ_LENGTH:
+                spans.append([address, address, []])
+            span = spans[-1]
+            span[1] = max(span[1], address + register.size)
+            span[2].append((index, register.struct, address - span[0]))
+        return [(self.prepare([start], end - start), decoders)
+                for start, end, decoders in spans]
+
+    def read_registers(self, *names):
+        """Read the named registers with as few transactions as possible.
+
+        Returns:
+            list. Decoded values in the order of *names*.
+
+        """
+        plan = self._plans.get(names)
+        if plan is None:
+            plan = self._plans[names] = self._plan(names)
+        values = [None] * len(names)
+        for transaction, decoders in plan:
+            data = transaction.execute()
+            if data is None:
+                raise SensorError("i2c read timeout at port %d" % self.port)
+            for index, decoder, offset in decoders:
+                values[index] = decoder.unpack_from(data, offset)[0]
+        return values
+
+    def read_register(self, name):
+        return self.read_registers(name)[0]
+
+
+__all__ = ['IICSensor', 'UartSensor', 'AnalogSensor', 'Register', 'RegisterMapSensor']
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+"""Generate the slim ev3/rawdevice/lms2012.py from the ctypesgen dump.
+
+ev3/rawdevice/lms2012full.py is the ctypesgen wrapper of lms2012.h. Most
+of it (library loader, string classes, libc structures, hundreds of
+constants) is never used, yet importing it dominates the start up time on
+the brick. This script writes a module holding only the names the package
+uses: every `lms2012.NAME` found in ev3/, the structures they need, the
+opcodes and the connection and device type constants.
+
+Usage:
+    python tools/gen_lms2012.py          # regenerate the module
+    python tools/gen_lms2012.py --check  # compare layouts and constants
+                                         # with the full module
+
+"""
+import argparse
+import ctypes
+import inspect
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ev3.rawdevice import lms2012full as full
+
+TARGET = os.path.join(ROOT, 'ev3', 'rawdevice', 'lms2012.py')
+# Kept for user programs, besides what the package itself uses.
+PREFIXES = ('op', 'CONN_', 'TYPE_')
+SUFFIXES = ('_DEVICE_NAME',)
+FUNCTIONS = ('CtoV', 'VtoC')
+# Constants used by FUNCTIONS.
+EXTRA = ('ADC_REF', 'ADC_RES')
+# Basic types from lmstypes.h.
+TYPEDEFS = ('UBYTE', 'UWORD', 'ULONG', 'SBYTE', 'SWORD', 'SLONG', 'DATA8', 'DATA16', 'DATA32',
+            'DATAF')
+
+# ctypes types whose size is the same for every target the module runs on.
+_PRIMITIVES = ['c_char', 'c_byte', 'c_ubyte', 'c_short', 'c_ushort', 'c_int', 'c_uint',
+               'c_float', 'c_double']
+
+HEADER = '''"""Structures and constants from lms2012.h used by the package.
+
+Generated by tools/gen_lms2012.py from lms2012full.py, the complete
+ctypesgen wrapper. Do not modify this file.
+
+"""
+from ctypes import %s
+'''
+
+
+def _used_names():
+    names = set()
+    pattern = re.compile(r'\blms2012\.([A-Za-z_]\w*)')
+    for directory, _, files in os.walk(os.path.join(ROOT, 'ev3')):
+        for name in files:
+            if name.endswith('.py') and not name.startswith('lms2012full'):
+                with open(os.path.join(directory, name)) as source:
+                    names.update(pattern.findall(source.read()))
+    names.discard('py')
+    names.discard('h')
+    for name in dir(full):
+        if name.startswith(PREFIXES) or name.endswith(SUFFIXES):
+            names.add(name)
+    names.update(FUNCTIONS)
+    names.update(EXTRA)
+    return sorted(name for name in names if hasattr(full, name))
+
+
+def _is_record(value):
+    return inspect.isclass(value) and issubclass(value, (ctypes.Structure, ctypes.Union))
+
+
+def _record_names():
+    # Typedef names for ctypesgen's anonymous structures.
+    names = {}
+    for name in sorted(dir(full)):
+        value = getattr(full, name)
+        if _is_record(value) and not name.startswith(('struct_', 'union_')):
+            names.setdefault(value, name)
+    for name in sorted(dir(full)):
+        value = getattr(full, name)
+        if _is_record(value):
+            names.setdefault(value, name.replace('struct_anon_', 'STRUCT_')
+                                        .replace('union_anon_', 'UNION_'))
+    return names
+
+
+def _type_name(ctype, records, needed, used):
+    if hasattr(ctype, '_length_'):
+        item = _type_name(ctype._type_, records, needed, used)
+        return '%s * %d' % ('(%s)' % item if ' ' in item else item, ctype._length_)
+    if _is_record(ctype):
+        needed.append(ctype)
+        return records[ctype]
+    for name in _PRIMITIVES:
+        if ctype is getattr(ctypes, name):
+            used.add(name)
+            return name
+    raise ValueError('no portable name for %r' % ctype)
+
+
+def _emit_records(roots, records, used):
+    lines = []
+    done = set()
+
+    def emit(record):
+        if record in done:
+            return
+        done.add(record)
+        needed = []
+        fields = ['        (%r, %s),' % (field[0], _type_name(field[1], records, needed, used))
+                  for field in record._fields_]
+        for dependency in needed:
+            emit(dependency)
+        base = 'Union' if issubclass(record, ctypes.Union) else 'Structure'
+        used.add(base)
+        lines.extend(['', '', 'class %s(%s):' % (records[record], base),
+                      '    _fields_ = ['] + fields + ['    ]'])
+
+    for record in roots:
+        emit(record)
+    return lines
+
+
+def generate():
+    records = _record_names()
+    names = _used_names()
+    constants, roots, functions = [], [], []
+    for name in names:
+        value = getattr(full, name)
+        if _is_record(value):
+            roots.append(value)
+        elif inspect.isfunction(value):
+            functions.append(inspect.getsource(value).rstrip())
+        elif isinstance(value, (int, long, float, str)):
+            constants.append('%s = %r' % (name, value))
+        else:
+            raise ValueError('cannot emit %s = %r' % (name, value))
+    used = set()
+    typedefs = ['%s = %s' % (name, _type_name(getattr(full, name), records, [], used))
+                for name in TYPEDEFS]
+    structures = _emit_records(roots, records, used)
+    imports = sorted(used, key=lambda name: (name.startswith('c_'), name))
+    lines = [(HEADER % ', '.join(imports)).rstrip(), ''] + typedefs + [''] + constants + structures
+    aliases = ['%s = %s' % (name, records[getattr(full, name)]) for name in names
+               if _is_record(getattr(full, name)) and records[getattr(full, name)] != name]
+    if aliases:
+        lines += [''] + aliases
+    for function in functions:
+        lines += ['', ''] + function.splitlines()
+    return '\n'.join(lines) + '\n'
+
+
+def _compare_layout(name, slim_type, full_type, errors):
+    if ctypes.sizeof(slim_type) != ctypes.sizeof(full_type) or \
+            ctypes.alignment(slim_type) != ctypes.alignment(full_type):
+        errors.append('%s: size or alignment differs' % name)
+        return
+    if hasattr(full_type, '_length_'):
+        if getattr(slim_type, '_length_', None) != full_type._length_:
+            errors.append('%s: array length differs' % name)
+        else:
+            _compare_layout(name + '[]', slim_type._type_, full_type._type_, errors)
+        return
+    if not _is_record(full_type):
+        if slim_type is not full_type:
+            errors.append('%s: %r is not %r' % (name, slim_type, full_type))
+        return
+    slim_fields = [field[0] for field in getattr(slim_type, '_fields_', [])]
+    full_fields = [field[0] for field in full_type._fields_]
+    if slim_fields != full_fields:
+        errors.append('%s: fields differ' % name)
+        return
+    for field, field_type in full_type._fields_:
+        slim_field = getattr(slim_type, field)
+        full_field = getattr(full_type, field)
+        if (slim_field.offset, slim_field.size) != (full_field.offset, full_field.size):
+            errors.append('%s.%s: offset or size differs' % (name, field))
+        _compare_layout('%s.%s' % (name, field), dict(slim_type._fields_)[field],
+                        field_type, errors)
+
+
+def check():
+    errors = []
+    with open(TARGET) as current:
+        if current.read() != generate():
+            errors.append('%s is out of date, run tools/gen_lms2012.py' % TARGET)
+    from ev3.rawdevice import lms2012 as slim
+    for name in _used_names() + list(TYPEDEFS):
+        expected = getattr(full, name)
+        if not hasattr(slim, name):
+            errors.append('%s: missing' % name)
+        elif _is_record(expected) or name in TYPEDEFS:
+            _compare_layout(name, getattr(slim, name), expected, errors)
+        elif inspect.isfunction(expected):
+            for sample in (0, 1, 2047, 4095, 5000):
+                if getattr(slim, name)(sample) != expected(sample):
+                    errors.append('%s(%d) differs' % (name, sample))
+        elif getattr(slim, name) != expected:
+            errors.append('%s: %r != %r' % (name, getattr(slim, name), expected))
+    for error in errors:
+        print(error)
+    print('%d names checked, %d errors' % (len(_used_names()) + len(TYPEDEFS), len(errors)))
+    return not errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--check', action='store_true',
+                        help='compare layouts and constants with the full module '
+                             'instead of writing it')
+    args = parser.parse_args()
+    if args.check:
+        sys.exit(0 if check() else 1)
+    with open(TARGET, 'w') as target:
+        target.write(generate())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Measure how long `import ev3` takes and what it loads.
+
+Each measurement runs in a fresh interpreter. The eager case imports
+every device module and PIL up front, the way `import ev3` used to,
+and is the baseline for the lazy case.
+
+Usage:
+    python tools/import_benchmark.py [runs]
+
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import sys, time
+start = time.time()
+%s
+elapsed = time.time() - start
+heavy = [m for m in ('ev3.rawdevice.lms2012', 'ev3.rawdevice.lcd', 'Image') if m in sys.modules]
+print('%%f %%d %%s' %% (elapsed, len(sys.modules), ','.join(heavy) or '-'))
+"""
+
+CASES = [
+    ('lazy', 'import ev3'),
+    ('eager', 'import ev3\n'
+              'from ev3.rawdevice import analogdevice, dcm, iicdevice, iicexecutor, lcd, '
+              'lms2012, motordevice, snapshot, sound, uartdevice, ui\n'
+              'import Image, ImageDraw'),
+]
+
+
+def measure(code, runs):
+    times = []
+    with open(os.devnull, 'w') as devnull:
+        for _ in range(runs):
+            output = subprocess.check_output([sys.executable, '-c', _PROBE % code],
+                                             cwd=ROOT, stderr=devnull)
+            elapsed, modules, heavy = output.split()
+            times.append(float(elapsed))
+    return min(times), sorted(times)[len(times) // 2], int(modules), heavy
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print('%-6s %10s %10s %8s  %s' % ('case', 'best ms', 'median ms', 'modules', 'heavy modules loaded'))
+    for name, code in CASES:
+        try:
+            best, median, modules, heavy = measure(code, runs)
+        except subprocess.CalledProcessError:
+            print('%-6s failed, is PIL installed?' % name)
+            continue
+        print('%-6s %10.1f %10.1f %8d  %s' % (name, best * 1000, median * 1000, modules, heavy))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""Count writes to /dev/lms_pwm and time motor commands.
+
+The first table covers the high-level motor actions, the second the
+per-command overhead of motordevice against the way it used to build
+commands (format string packing, a new ctypes struct per command) and
+the cost of a command dropped by the output state cache.
+
+On the brick pass --device to drive the real motor device (motors on
+ports A and B will move). Anywhere else the commands go to /dev/null,
+which measures the Python side and the syscall count only.
+
+Usage:
+    python tools/motor_benchmark.py [--device] [runs]
+
+"""
+import itertools
+import os
+import struct
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ev3.rawdevice import lms2012, motordevice
+from ev3.motor.lego import EV3Drive, EV3Motor
+
+
+class _CountingOs(object):
+    # Stands in for the os module inside motordevice to count writes.
+
+    def __init__(self):
+        self.writes = 0
+
+    def write(self, fd, data):
+        self.writes += 1
+        return os.write(fd, data)
+
+    def __getattr__(self, name):
+        return getattr(os, name)
+
+
+def _open(device):
+    if device:
+        motordevice.open_device()
+        return
+    motordevice._pwmfile = os.open(os.devnull, os.O_WRONLY)
+    motordevice._motordata = (lms2012.MOTORDATA * 4)()
+
+
+def actions():
+    motor = EV3Motor(0)
+    drive = EV3Drive([0, 1])
+    return [
+        ('EV3Motor.start', lambda: motor.start(EV3Motor.MOVE_FORWARD, 50)),
+        ('EV3Motor.set_speed', lambda: motor.set_speed(60)),
+        ('EV3Motor.stop', motor.stop),
+        ('EV3Drive.start', lambda: drive.start(EV3Motor.MOVE_FORWARD, 50)),
+        ('EV3Drive.start [0,1]', lambda: drive.start(EV3Motor.MOVE_FORWARD, 50, [0, 1])),
+        ('EV3Drive.set_speed', lambda: drive.set_speed(60)),
+        ('EV3Drive.stop', drive.stop),
+        ('motordevice.reset', lambda: motordevice.reset(3)),
+    ]
+
+
+def _packed_speed(ports, speed):
+    # motordevice.speed(ports, speed, False) as it used to be.
+    os.write(motordevice._pwmfile, struct.pack('3B', lms2012.opOUTPUT_SPEED, ports, speed))
+
+
+def _new_step_speed(ports, speed, ramp_up_steps, const_speed_steps, ramp_down_steps, brake=0):
+    # motordevice.step_speed(..., startmotor=False) as it used to be.
+    stepspeed = lms2012.STEPSPEED()
+    stepspeed.Cmd = lms2012.opOUTPUT_STEP_SPEED
+    stepspeed.Nos = ports
+    stepspeed.Speed = speed
+    stepspeed.Step1 = ramp_up_steps
+    stepspeed.Step2 = const_speed_steps
+    stepspeed.Step3 = ramp_down_steps
+    stepspeed.Brake = brake
+    os.write(motordevice._pwmfile, stepspeed)
+
+
+def commands():
+    # Alternate the speed so that the output state cache does not drop them.
+    speeds = itertools.cycle((50, 51))
+    return [
+        ('speed', lambda: motordevice.speed(1, next(speeds), False),
+         lambda: _packed_speed(1, next(speeds))),
+        ('speed, unchanged', lambda: motordevice.speed(1, 50, False),
+         lambda: _packed_speed(1, 50)),
+        ('step_speed', lambda: motordevice.step_speed(1, 50, 0, 360, 0, startmotor=False),
+         lambda: _new_step_speed(1, 50, 0, 360, 0)),
+    ]
+
+
+def _time(function, runs, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        for _ in range(runs):
+            function()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e6 / runs
+
+
+def main():
+    args = sys.argv[1:]
+    device = '--device' in args
+    numbers = [arg for arg in args if not arg.startswith('--')]
+    runs = int(numbers[0]) if numbers else 1000
+    _open(device)
+    counter = motordevice.os = _CountingOs()
+    print('%-20s %8s %10s' % ('action', 'writes', 'us/call'))
+    for name, action in actions():
+        action()
+        counter.writes = 0
+        start = time.time()
+        for _ in range(runs):
+            action()
+        elapsed = time.time() - start
+        print('%-20s %8.1f %10.1f' % (name, float(counter.writes) / runs, elapsed * 1e6 / runs))
+    motordevice.os = os
+    print('')
+    print('%-20s %10s %10s' % ('command', 'us/call', 'before'))
+    for name, command, before in commands():
+        print('%-20s %10.2f %10.2f' % (name, _time(command, runs), _time(before, runs)))
+    if device:
+        motordevice.stop(15)
+        motordevice.close_device()
+
+
+if __name__ == '__main__':
+    main()